@@ -3,44 +3,225 @@ FastAPI Server for Content Gap Analysis
 Provides REST API endpoints for supervisor agents to trigger analysis and retrieve results
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List
+from fastapi.responses import FileResponse, ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, Dict, Any, Callable, Iterator, List, Set, Tuple
 from pathlib import Path
 from datetime import datetime
+from dataclasses import dataclass, field, replace
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from fnmatch import fnmatch
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from anyio import to_thread
+import asyncio
+import hashlib
 import json
+import mmap
 import os
+import sys
+import tempfile
+import threading
+import time
+
+import orjson
+
+try:
+    import fcntl
+except ImportError:  # Windows; multi-worker mode (gunicorn) is POSIX-only anyway
+    fcntl = None
 
 # Import the orchestrator
 from main import ContentGapAnalysisOrchestrator, create_sample_content_files
+from dashboard_specs import DashboardSpecGenerator, spec_json_bytes
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Content Gap Analysis API",
     description="AI-powered content gap analysis with ML recommendations",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
-# Configure CORS to allow requests from supervisor agents
+# Configure CORS to allow requests from supervisor agents. Origins are matched
+# against an allowlist regex (override with ALLOWED_ORIGIN_REGEX); the explicit
+# method/header lists and max_age let browsers cache preflights for a day
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Allow all origins (you can restrict this to specific domains)
+    allow_origin_regex=os.getenv(
+        "ALLOWED_ORIGIN_REGEX",
+        r"^https?://(localhost|127\.0\.0\.1|[\w-]+\.ngrok(-free)?\.(app|dev|io))(:\d+)?$"
+    ),
     allow_credentials=True,
-    allow_methods=["*"],  # Allow all HTTP methods (GET, POST, etc.)
-    allow_headers=["*"],  # Allow all headers
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "if-none-match", "if-modified-since"],
+    max_age=86400,
 )
 
-# Global storage for analysis results (in-memory cache)
-last_result: Optional[Dict[str, Any]] = None
-last_metrics: Optional[Dict[str, Any]] = None
-last_job_id: Optional[str] = None
-analysis_running: bool = False
+
+@dataclass(frozen=True)
+class JobState:
+    """
+    Immutable snapshot of the latest analysis job and its cached results
+
+    Writers build a new instance and swap ``app.state.job`` in one assignment;
+    readers load ``app.state.job`` once and only use that local snapshot.
+    """
+    job_id: Optional[str] = None
+    status: Optional[str] = None  # queued | running | completed | failed
+    running: bool = False
+    started_at: Optional[str] = None
+    completed_at: Optional[str] = None
+    # Pre-serialized GET payloads: name -> (body, etag). Only these projections
+    # are kept; the result dict itself is dropped once they are built
+    payloads: Dict[str, Tuple[bytes, str]] = field(default_factory=dict)
+    # mtime of the package file the results correspond to (multi-worker sync)
+    package_mtime_ns: int = 0
+    # mtime of the shared job file the job fields were last read from
+    job_mtime_ns: int = 0
+
+
+# In-memory cache of the latest analysis results
+app.state.job = JobState()
+_state_lock = threading.Lock()
+
+# Analysis jobs run in a worker process so the event loop stays responsive.
+# Only one job runs at a time (_run_lock), so a single worker suffices and
+# keeps one warm set of cached orchestrators instead of one per process.
+# The pool is created on the first job, so importing this module starts nothing,
+# and is owned by one process: a gunicorn worker forked after --preload (or
+# any other fork) builds its own instead of using the parent's queues and threads
+_executor: Optional[Tuple[int, ProcessPoolExecutor]] = None
+_executor_lock = threading.Lock()
+_run_lock = threading.Lock()
+
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# With several server processes the package file on disk is the shared store:
+# each worker reloads it when another worker's job has rewritten it. The job
+# file next to it carries the job id, status and times the same way
+_PACKAGE_PATH = 'content_gap_analysis_package.json'
+_JOB_PATH = 'content_gap_analysis_job.json'
+_JOB_FIELDS = ("job_id", "status", "running", "started_at", "completed_at")
+_API_WORKERS = int(os.getenv("API_WORKERS", "1"))
+_SHARED_STATE = _API_WORKERS > 1
+
+# _run_lock only covers this process; with several workers an flock on this
+# file makes "one job at a time" hold across all of them (the OS drops the
+# lock if the holding worker dies)
+_RUN_LOCK_PATH = f"{_PACKAGE_PATH}.lock"
+_run_lock_fd: Optional[int] = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Return this process's analysis pool, creating it on first use"""
+    global _executor
+    pid = os.getpid()
+    with _executor_lock:
+        if _executor is None or _executor[0] != pid:
+            # A pool inherited through fork is unusable here; its management
+            # thread did not survive, so it is dropped rather than shut down
+            _executor = (pid, ProcessPoolExecutor(max_workers=1))
+        return _executor[1]
+
+
+def _acquire_run_lock() -> bool:
+    """Take the job lock without blocking; False if a job is already running"""
+    global _run_lock_fd
+    if not _run_lock.acquire(blocking=False):
+        return False
+    if _SHARED_STATE and fcntl is not None:
+        fd = -1
+        try:
+            fd = os.open(_RUN_LOCK_PATH, os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            if fd >= 0:
+                os.close(fd)
+            _run_lock.release()
+            return False
+        _run_lock_fd = fd
+    return True
+
+
+def _release_run_lock() -> None:
+    """Release the lock taken by _acquire_run_lock"""
+    global _run_lock_fd
+    if _run_lock_fd is not None:
+        fcntl.flock(_run_lock_fd, fcntl.LOCK_UN)
+        os.close(_run_lock_fd)
+        _run_lock_fd = None
+    _run_lock.release()
+
+
+# (epoch second, ISO string) for the last formatted timestamp; swapped as one tuple
+_ts_cache: Tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """Current local time as ISO 8601, formatted at most once per second"""
+    global _ts_cache
+    t = int(time.time())
+    cached_t, cached_iso = _ts_cache
+    if t != cached_t:
+        cached_iso = datetime.fromtimestamp(t).isoformat()
+        _ts_cache = (t, cached_iso)
+    return cached_iso
+
+
+# Server-Sent Events subscribers, one queue per open /events connection
+_subscribers: Set[asyncio.Queue] = set()
+_event_loop: Optional[asyncio.AbstractEventLoop] = None
+_SSE_KEEPALIVE_SECONDS = 15.0
+_SSE_SHARED_POLL_SECONDS = 1.0
+
+
+def _publish_event(event: Dict[str, Any]) -> None:
+    """Push an event to every /events subscriber (safe to call from any thread)"""
+    if _event_loop is None or not _subscribers:
+        return
+    message = orjson.dumps(event).decode()
+    for queue in list(_subscribers):
+        _event_loop.call_soon_threadsafe(queue.put_nowait, message)
+
+
+def _update_job(**changes: Any) -> JobState:
+    """Publish a new JobState with the given fields replaced"""
+    with _state_lock:
+        previous = app.state.job
+        app.state.job = replace(previous, **changes)
+        job = app.state.job
+    
+    if job.status != previous.status or job.job_id != previous.job_id:
+        _publish_event({"job_id": job.job_id, "status": job.status, "timestamp": _now_iso()})
+    return job
+
+
+def _set_job(**changes: Any) -> JobState:
+    """Update the job and, with several workers, publish its fields to the job file"""
+    job = _update_job(**changes)
+    if _SHARED_STATE:
+        # Unique temp file: the /run handler and the job thread may both write
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=".", prefix=f"{_JOB_PATH}.", suffix=".tmp")
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps({k: getattr(job, k) for k in _JOB_FIELDS}))
+            os.replace(tmp_path, _JOB_PATH)
+        except OSError as e:
+            print(f"[API] Could not write shared job state: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+    return job
 
 
 class AnalysisRequest(BaseModel):
     """Request model for triggering analysis"""
+    model_config = ConfigDict(frozen=True)
+    
     min_recommendations: int = Field(default=12, ge=1, le=100, description="Minimum recommendations to generate")
     your_organization: str = Field(default="OpenProject", description="Your organization name")
     competitors: List[str] = Field(default=["Asana", "Trello", "Monday.com"], description="Competitor names")
@@ -58,214 +239,467 @@ class AnalysisResponse(BaseModel):
     model_accuracy: Optional[float] = None
 
 
-def _discover_files(folder: str) -> List[str]:
-    """Discover content files in a directory"""
-    base = Path(folder)
-    if not base.exists():
+# Shared default for bodyless GET /run requests
+_DEFAULT_REQUEST = AnalysisRequest()
+
+
+_CONTENT_EXTS = frozenset({".txt", ".json", ".html", ".md", ".htm"})
+_FILE_CACHE_SIZE = 8  # two folders x two listing kinds, with headroom
+# (folder, walker name) -> (((dir, mtime_ns), ...) for every directory walked, files)
+_FILE_CACHE: "OrderedDict[tuple, Tuple[Tuple[Tuple[str, int], ...], List[str]]]" = OrderedDict()
+
+
+def _walk(folder: str, project: Callable[[os.DirEntry], str],
+          visited: Optional[List[Tuple[str, int]]] = None) -> Iterator[str]:
+    """
+    Yield project(entry) for every content file under folder (iterative scandir)
+
+    If visited is given, (directory, mtime_ns) is appended for each directory
+    walked; the mtime is read before the directory is listed.
+    """
+    stack = [folder]
+    while stack:
+        directory = stack.pop()
+        try:
+            if visited is not None:
+                visited.append((directory, os.stat(directory).st_mtime_ns))
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        name = entry.name
+                        i = name.rfind('.')
+                        if i >= 0 and name[i:].lower() in _CONTENT_EXTS:
+                            yield project(entry)
+        except OSError:
+            continue
+
+
+def _iter_content_files(folder: str, visited: Optional[List[Tuple[str, int]]] = None) -> Iterator[str]:
+    """Yield full paths of content files under folder"""
+    return _walk(folder, lambda entry: entry.path, visited)
+
+
+def _iter_content_names(folder: str, visited: Optional[List[Tuple[str, int]]] = None) -> Iterator[str]:
+    """Yield bare file names of content files under folder"""
+    return _walk(folder, lambda entry: entry.name, visited)
+
+
+def _dirs_unchanged(dir_mtimes: Tuple[Tuple[str, int], ...]) -> bool:
+    """True if every directory still has the mtime recorded when it was walked"""
+    try:
+        return all(os.stat(d).st_mtime_ns == mtime_ns for d, mtime_ns in dir_mtimes)
+    except OSError:
+        return False
+
+
+def _cached_listing(folder: str, walker: Callable[..., Iterator[str]]) -> List[str]:
+    """
+    Materialize walker(folder), cached until any directory in the tree changes
+
+    The mtimes of every directory walked are recorded with the listing. A
+    repeat call only stats those directories, and walks again if a file or
+    subfolder was added, removed or renamed anywhere in the tree.
+    """
+    if not os.path.isdir(folder):
         return []
-    exts = {".txt", ".json", ".html", ".md", ".htm"}
-    files = []
-    for p in base.rglob("*"):
-        if p.is_file() and p.suffix.lower() in exts:
-            files.append(str(p))
-    return files
+    
+    key = (folder, walker.__name__)
+    cached = _FILE_CACHE.get(key)
+    if cached is not None and _dirs_unchanged(cached[0]):
+        _FILE_CACHE.move_to_end(key)
+        return list(cached[1])
+    
+    visited: List[Tuple[str, int]] = []
+    files = list(walker(folder, visited))
+    _FILE_CACHE[key] = (tuple(visited), files)
+    _FILE_CACHE.move_to_end(key)
+    if len(_FILE_CACHE) > _FILE_CACHE_SIZE:
+        _FILE_CACHE.popitem(last=False)
+    return list(files)
+
+
+def _discover_files(folder: str) -> List[str]:
+    """Discover content files in a directory (full paths)"""
+    return _cached_listing(folder, _iter_content_files)
+
+
+def _discover_file_names(folder: str) -> List[str]:
+    """Discover content file names in a directory (no Path objects built)"""
+    return _cached_listing(folder, _iter_content_names)
+
+
+@lru_cache(maxsize=8)
+def _get_orchestrator(your_organization: str,
+                      competitors: Tuple[str, ...]) -> ContentGapAnalysisOrchestrator:
+    """
+    Return an orchestrator for this configuration, reused across runs
+
+    Construction loads the NLP models, so each worker process keeps one
+    orchestrator per (organization, competitors) and resets it between runs.
+    """
+    return ContentGapAnalysisOrchestrator(
+        your_organization=your_organization,
+        competitors=list(competitors)
+    )
+
+
+def _do_analysis(request_dict: Dict[str, Any], your_files: List[str],
+                 competitor_files: List[str]) -> Dict[str, Any]:
+    """Run the full analysis pipeline (executed in a worker process)"""
+    request = AnalysisRequest(**request_dict)
+
+    orchestrator = _get_orchestrator(request.your_organization, tuple(request.competitors))
+    orchestrator.reset()
+
+    results = orchestrator.run_full_analysis(
+        your_content_files=your_files,
+        competitor_content_files=competitor_files,
+        min_recommendations=request.min_recommendations
+    )
+
+    # Fallback: if no gaps/recommendations were produced, re-run with sample content
+    if len(results.get('gaps', [])) == 0 and len(results.get('recommendations', [])) == 0:
+        print("[API] No gaps/recommendations found. Executing sample content fallback run...")
+        sample_your, sample_comp = create_sample_content_files()
+        results = orchestrator.run_full_analysis(
+            your_content_files=sample_your,
+            competitor_content_files=sample_comp,
+            min_recommendations=request.min_recommendations
+        )
+
+    # Save results to JSON file for dashboard
+    with open(_PACKAGE_PATH, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+
+    return results
+
+
+def _build_payloads(results: Dict[str, Any]) -> Dict[str, Tuple[bytes, str]]:
+    """Serialize the result views served by GET endpoints and tag each with an ETag"""
+    completed_at = _now_iso()
+    recommendations = results.get('recommendations', [])
+    gaps = results.get('gaps', [])
+    views = {
+        "package": results,
+        "metrics": results.get('model_metrics', {}),
+        "recommendations": {
+            "count": len(recommendations),
+            "recommendations": recommendations,
+            "timestamp": completed_at
+        },
+        "gaps": {
+            "count": len(gaps),
+            "gaps": gaps,
+            "timestamp": completed_at
+        },
+    }
+    payloads = {}
+    for name, view in views.items():
+        body = orjson.dumps(view, option=_ORJSON_OPTS)
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        payloads[name] = (body, etag)
+    return payloads
+
+
+def _package_mtime_ns() -> int:
+    """Return the package file mtime, or 0 if it does not exist yet"""
+    try:
+        return os.stat(_PACKAGE_PATH).st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+def _job_mtime_ns() -> int:
+    """Return the shared job file mtime, or 0 if it does not exist yet"""
+    try:
+        return os.stat(_JOB_PATH).st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+def _reload_shared_job(job: JobState) -> JobState:
+    """Pick up job id/status/times another worker wrote to the job file"""
+    mtime_ns = _job_mtime_ns()
+    if mtime_ns == 0 or mtime_ns == job.job_mtime_ns:
+        return job
+    
+    try:
+        with open(_JOB_PATH, 'rb') as f:
+            shared = orjson.loads(f.read())
+    except (OSError, ValueError):
+        return job
+    
+    changes = {k: shared.get(k) for k in _JOB_FIELDS}
+    changes["running"] = bool(changes["running"])
+    return _update_job(job_mtime_ns=mtime_ns, **changes)
+
+
+def _current_job() -> JobState:
+    """Return the current JobState, picking up jobs and results of other workers"""
+    job = app.state.job
+    if not _SHARED_STATE:
+        return job
+    
+    job = _reload_shared_job(job)
+    mtime_ns = _package_mtime_ns()
+    if mtime_ns == 0 or mtime_ns == job.package_mtime_ns:
+        return job
+    
+    try:
+        # Parse straight from the page cache rather than copying into a buffer
+        with open(_PACKAGE_PATH, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                memoryview(mm) as view:
+            results = orjson.loads(view)
+    except (OSError, ValueError):
+        # File is mid-write by another worker (JSONDecodeError and the empty-file
+        # mmap error are both ValueErrors); serve what we have
+        return job
+    
+    return _update_job(
+        payloads=_build_payloads(results),
+        package_mtime_ns=mtime_ns
+    )
+
+
+def _shared_files_changed(job: JobState) -> bool:
+    """Whether the job or package file changed since job was loaded from them"""
+    return (_job_mtime_ns() not in (0, job.job_mtime_ns) or
+            _package_mtime_ns() not in (0, job.package_mtime_ns))
+
+
+async def _current_job_async() -> JobState:
+    """
+    _current_job for async handlers
+    
+    Two stats tell whether another worker rewrote the shared files; only
+    then does the reload, which parses the whole package, run in the
+    threadpool instead of blocking the event loop.
+    """
+    job = app.state.job
+    if not _SHARED_STATE or not _shared_files_changed(job):
+        return job
+    return await to_thread.run_sync(_current_job)
+
+
+async def _cached_response(request: Request, name: str, not_found: str) -> Response:
+    """Return a pre-serialized payload, or 304 if the client's ETag still matches"""
+    cached = (await _current_job_async()).payloads.get(name)
+    if cached is None:
+        raise HTTPException(status_code=404, detail=not_found)
+    
+    body, etag = cached
+    return _etag_response(request, body, etag, "private, max-age=0, must-revalidate")
+
+
+def _etag_response(request: Request, body: bytes, etag: str, cache_control: str) -> Response:
+    """Return a JSON body tagged with its ETag, or 304 if the client's copy matches"""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or
+                          etag in (tag.strip() for tag in if_none_match.split(","))):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@lru_cache(maxsize=None)
+def _spec_payload(name: Optional[str] = None) -> Tuple[bytes, str]:
+    """Pre-encoded dashboard specs (all, or one by name) with their ETag"""
+    body = spec_json_bytes(name)
+    return body, f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _run_job(job_id: str, request: AnalysisRequest, your_files: List[str],
+             competitor_files: List[str]) -> None:
+    """
+    Execute an analysis job and cache its results
+
+    Registered as a plain (sync) background task so FastAPI runs it in the
+    anyio threadpool; the CPU-bound pipeline itself runs in a worker process.
+    """
+    try:
+        print(f"\n[API] Starting analysis job: {job_id}")
+        _set_job(status="running", started_at=_now_iso())
+        results = _get_executor().submit(
+            _do_analysis, request.model_dump(), your_files, competitor_files
+        ).result()
+        _set_job(
+            status="completed",
+            running=False,
+            completed_at=_now_iso(),
+            payloads=_build_payloads(results),
+            package_mtime_ns=_package_mtime_ns()
+        )
+        print(f"[API] Analysis job {job_id} completed successfully")
+    except Exception as e:
+        _set_job(status="failed", running=False, completed_at=_now_iso())
+        print(f"[API] Analysis job {job_id} failed: {e}")
+    finally:
+        _release_run_lock()
+
+
+@app.on_event("startup")
+async def _raise_threadpool_limit():
+    """Raise anyio's default threadpool limit so long jobs don't starve sync handlers"""
+    to_thread.current_default_thread_limiter().total_tokens = 32
+
+
+@app.on_event("startup")
+async def _capture_event_loop():
+    """Remember the server loop so worker threads can push /events messages"""
+    global _event_loop
+    _event_loop = asyncio.get_running_loop()
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
+    job = await _current_job_async()
     return {
         "status": "healthy",
         "service": "Content Gap Analysis API",
         "version": "1.0.0",
-        "timestamp": datetime.now().isoformat(),
-        "analysis_running": analysis_running,
-        "last_job_id": last_job_id
+        "timestamp": _now_iso(),
+        "analysis_running": job.running,
+        "last_job_id": job.job_id
     }
 
 
-@app.api_route("/run", methods=["GET", "POST"], response_model=AnalysisResponse)
-async def run_analysis(request: AnalysisRequest = None, background_tasks: BackgroundTasks = None):
+# response_model=None: AnalysisResponse is validated on construction, so skip
+# FastAPI's second validation pass; `responses` keeps the OpenAPI schema
+@app.api_route("/run", methods=["GET", "POST"], response_model=None,
+               responses={200: {"model": AnalysisResponse}})
+async def run_analysis(background_tasks: BackgroundTasks, request: AnalysisRequest = None):
     """
     Trigger content gap analysis
     
-    Discovers files from data/your_content and data/competitor_content,
-    runs full analysis pipeline, and caches results.
+    Discovers files from data/your_content and data/competitor_content and
+    queues the full analysis pipeline as a background task. Returns the job ID
+    immediately; poll /status for completion.
     """
-    global last_result, last_metrics, last_job_id, analysis_running
-    
     # Handle GET requests without body - use defaults
     if request is None:
-        request = AnalysisRequest()
+        request = _DEFAULT_REQUEST
     
-    if analysis_running:
+    if _run_lock.locked():
         raise HTTPException(status_code=409, detail="Analysis already running. Please wait.")
     
-    # Use default request if none provided (for GET requests)
-    if request is None:
-        request = AnalysisRequest()
+    # Discover input files
+    your_files = _discover_files('data/your_content')
+    competitor_files = _discover_files('data/competitor_content')
+    
+    if not your_files:
+        raise HTTPException(
+            status_code=400,
+            detail="No content files found in data/your_content. Please add content files."
+        )
+    
+    if not competitor_files:
+        raise HTTPException(
+            status_code=400,
+            detail="No content files found in data/competitor_content. Please add competitor files."
+        )
+    
+    if not _acquire_run_lock():
+        raise HTTPException(status_code=409, detail="Analysis already running. Please wait.")
     
     # Generate job ID
     job_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-    last_job_id = job_id
-    analysis_running = True
+    _set_job(job_id=job_id, status="queued", running=True, started_at=None, completed_at=None)
     
     # Ensure reports directory exists
     os.makedirs("reports", exist_ok=True)
     
-    try:
-        # Discover input files
-        your_files = _discover_files('data/your_content')
-        competitor_files = _discover_files('data/competitor_content')
-        
-        if not your_files:
-            raise HTTPException(
-                status_code=400,
-                detail="No content files found in data/your_content. Please add content files."
-            )
-        
-        if not competitor_files:
-            raise HTTPException(
-                status_code=400,
-                detail="No content files found in data/competitor_content. Please add competitor files."
-            )
-        
-        # Initialize orchestrator
-        orchestrator = ContentGapAnalysisOrchestrator(
-            your_organization=request.your_organization,
-            competitors=request.competitors
-        )
-        
-        # Run analysis
-        print(f"\n[API] Starting analysis job: {job_id}")
-        results = orchestrator.run_full_analysis(
-            your_content_files=your_files,
-            competitor_content_files=competitor_files,
-            min_recommendations=request.min_recommendations
-        )
-
-        # Fallback: if no gaps/recommendations were produced, re-run with sample content
-        if len(results.get('gaps', [])) == 0 and len(results.get('recommendations', [])) == 0:
-            print("[API] No gaps/recommendations found. Executing sample content fallback run...")
-            sample_your, sample_comp = create_sample_content_files()
-            results = orchestrator.run_full_analysis(
-                your_content_files=sample_your,
-                competitor_content_files=sample_comp,
-                min_recommendations=request.min_recommendations
-            )
-        
-        # Cache results
-        last_result = results
-        last_metrics = results.get('model_metrics', {})
-        
-        # Save results to JSON file for dashboard
-        with open('content_gap_analysis_package.json', 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
-        
-        print(f"[API] Analysis job {job_id} completed successfully")
-        
-        return AnalysisResponse(
-            job_id=job_id,
-            status="completed",
-            message="Analysis completed successfully",
-            timestamp=datetime.now().isoformat(),
-            estimated_duration_seconds=0,
-            gap_count=len(results.get('gaps', [])),
-            recommendation_count=len(results.get('recommendations', [])),
-            model_accuracy=last_metrics.get('accuracy')
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        print(f"[API] Analysis job {job_id} failed: {e}")
-        raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
-    finally:
-        analysis_running = False
+    background_tasks.add_task(_run_job, job_id, request, your_files, competitor_files)
+    
+    return AnalysisResponse(
+        job_id=job_id,
+        status="queued",
+        message="Analysis queued. Poll /status for completion.",
+        timestamp=_now_iso(),
+        estimated_duration_seconds=120
+    )
 
 
 @app.get("/package")
-async def get_package():
+async def get_package(request: Request):
     """
     Retrieve the complete analysis package
     
     Returns the full JSON package with gaps, recommendations, metrics, etc.
     """
-    global last_result
-    
-    if last_result is None:
-        raise HTTPException(
-            status_code=404,
-            detail="No analysis results available. Run /run endpoint first."
-        )
-    
-    return JSONResponse(content=last_result)
+    return await _cached_response(
+        request, "package",
+        "No analysis results available. Run /run endpoint first."
+    )
 
 
 @app.get("/metrics")
-async def get_metrics():
+async def get_metrics(request: Request):
     """
     Retrieve ML model performance metrics
     
     Returns accuracy, precision, recall, F1 scores, confusion matrix, etc.
     """
-    global last_metrics
-    
-    if last_metrics is None:
-        raise HTTPException(
-            status_code=404,
-            detail="No metrics available. Run /run endpoint first."
-        )
-    
-    return JSONResponse(content=last_metrics)
+    return await _cached_response(
+        request, "metrics",
+        "No metrics available. Run /run endpoint first."
+    )
 
 
 @app.get("/recommendations")
-async def get_recommendations():
+async def get_recommendations(request: Request):
     """
     Retrieve content recommendations only
     
     Returns prioritized list of content recommendations.
     """
-    global last_result
-    
-    if last_result is None:
-        raise HTTPException(
-            status_code=404,
-            detail="No recommendations available. Run /run endpoint first."
-        )
-    
-    recommendations = last_result.get('recommendations', [])
-    
-    return {
-        "count": len(recommendations),
-        "recommendations": recommendations,
-        "timestamp": datetime.now().isoformat()
-    }
+    return await _cached_response(
+        request, "recommendations",
+        "No recommendations available. Run /run endpoint first."
+    )
 
 
 @app.get("/gaps")
-async def get_gaps():
+async def get_gaps(request: Request):
     """
     Retrieve identified content gaps
     
     Returns list of content gaps with impact scores and classifications.
     """
-    global last_result
+    return await _cached_response(
+        request, "gaps",
+        "No gaps available. Run /run endpoint first."
+    )
+
+
+@app.get("/specs")
+async def get_specs(request: Request):
+    """
+    Retrieve the dashboard visualization specifications
     
-    if last_result is None:
-        raise HTTPException(
-            status_code=404,
-            detail="No gaps available. Run /run endpoint first."
-        )
+    The specs are static for a deployment, so clients revalidating with
+    If-None-Match get a 304 with no body.
+    """
+    body, etag = _spec_payload()
+    return _etag_response(request, body, etag, "public, max-age=60")
+
+
+@app.get("/specs/{name}")
+async def get_spec(name: str, request: Request):
+    """
+    Retrieve a single dashboard specification
     
-    gaps = last_result.get('gaps', [])
+    name is one of: gap_table, topic_heatmap, impact_chart, model_metrics,
+    timeline. Lets a view fetch only the spec it renders.
+    """
+    if name not in DashboardSpecGenerator.generate_all_specs():
+        raise HTTPException(status_code=404, detail=f"Unknown dashboard spec '{name}'.")
     
-    return {
-        "count": len(gaps),
-        "gaps": gaps,
-        "timestamp": datetime.now().isoformat()
-    }
+    body, etag = _spec_payload(name)
+    return _etag_response(request, body, etag, "public, max-age=60")
 
 
 @app.get("/status")
@@ -275,15 +709,62 @@ async def get_status():
     
     Returns whether analysis is running and last job information.
     """
+    job = await _current_job_async()
     return {
-        "analysis_running": analysis_running,
-        "last_job_id": last_job_id,
-        "has_results": last_result is not None,
-        "has_metrics": last_metrics is not None,
-        "timestamp": datetime.now().isoformat()
+        "analysis_running": job.running,
+        "last_job_id": job.job_id,
+        "job_status": job.status,
+        "started_at": job.started_at,
+        "completed_at": job.completed_at,
+        "has_results": "package" in job.payloads,
+        "has_metrics": "metrics" in job.payloads,
+        "timestamp": _now_iso()
     }
 
 
+@app.get("/events")
+async def events():
+    """
+    Stream job status changes as Server-Sent Events
+    
+    Sends one event per state transition (queued, running, completed, failed)
+    instead of requiring clients to poll /status.
+    """
+    async def stream():
+        queue: asyncio.Queue = asyncio.Queue()
+        _subscribers.add(queue)
+        try:
+            job = await _current_job_async()
+            hello = {"state": "connected", "job_id": job.job_id, "status": job.status}
+            yield f"data: {orjson.dumps(hello).decode()}\n\n"
+            # With several workers, jobs run elsewhere only show up in the shared
+            # job file, so check it every second; reloading publishes the change
+            poll = _SSE_SHARED_POLL_SECONDS if _SHARED_STATE else _SSE_KEEPALIVE_SECONDS
+            idle = 0.0
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), poll)
+                except asyncio.TimeoutError:
+                    if _SHARED_STATE:
+                        await _current_job_async()
+                    idle += poll
+                    if idle >= _SSE_KEEPALIVE_SECONDS:
+                        # Comment line keeps proxies from closing an idle connection
+                        idle = 0.0
+                        yield ": keep-alive\n\n"
+                    continue
+                idle = 0.0
+                yield f"data: {message}\n\n"
+        finally:
+            _subscribers.discard(queue)
+    
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @app.get("/files")
 async def list_files():
     """
@@ -291,88 +772,137 @@ async def list_files():
     
     Returns discovered content files in both directories.
     """
-    your_files = _discover_files('data/your_content')
-    competitor_files = _discover_files('data/competitor_content')
+    your_files = _discover_file_names('data/your_content')
+    competitor_files = _discover_file_names('data/competitor_content')
     
     return {
         "your_content": {
             "count": len(your_files),
-            "files": [str(Path(f).name) for f in your_files]
+            "files": your_files
         },
         "competitor_content": {
             "count": len(competitor_files),
-            "files": [str(Path(f).name) for f in competitor_files]
+            "files": competitor_files
         },
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
 
 
-@app.get("/download/report")
-async def download_report():
-    """Download the markdown report"""
-    report_path = Path("reports/content_gap_analysis_report.md")
-    if not report_path.exists():
-        raise HTTPException(status_code=404, detail="Report not found. Run analysis first.")
-    return FileResponse(report_path, media_type="text/markdown", filename="content_gap_report.md")
-
-
-@app.get("/download/pdf")
-async def download_pdf():
-    """Download the PDF report"""
-    pdf_path = Path("reports/content_gap_analysis_report.pdf")
-    if not pdf_path.exists():
-        raise HTTPException(status_code=404, detail="PDF not found. Run analysis first.")
-    return FileResponse(pdf_path, media_type="application/pdf", filename="content_gap_report.pdf")
-
-
-@app.get("/download/presentation")
-async def download_presentation():
-    """Download the presentation markdown"""
-    pres_path = Path("presentations/executive_presentation.md")
-    if not pres_path.exists():
-        raise HTTPException(status_code=404, detail="Presentation not found. Run analysis first.")
-    return FileResponse(pres_path, media_type="text/markdown", filename="executive_presentation.md")
-
-
-@app.get("/download/dashboard")
-async def download_dashboard_specs():
-    """Download dashboard specifications JSON"""
-    dash_path = Path("dashboards/dashboard_specifications.json")
-    if not dash_path.exists():
-        raise HTTPException(status_code=404, detail="Dashboard specs not found. Run analysis first.")
-    return FileResponse(dash_path, media_type="application/json", filename="dashboard_specs.json")
-
-
-@app.get("/download/pptx")
-async def download_pptx():
-    """Download the PowerPoint presentation"""
-    pptx_path = Path("presentations/executive_presentation.pptx")
-    if not pptx_path.exists():
-        raise HTTPException(status_code=404, detail="PPTX not found. Run analysis first.")
-    return FileResponse(
-        pptx_path, 
-        media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-        filename="executive_presentation.pptx"
-    )
+# Downloadable artifacts: key -> (path, media type, download filename, label)
+_DOWNLOADS: Dict[str, Tuple[Path, str, str, str]] = {
+    "report": (Path("reports/content_gap_analysis_report.md"), "text/markdown",
+               "content_gap_report.md", "Report"),
+    "pdf": (Path("reports/content_gap_analysis_report.pdf"), "application/pdf",
+            "content_gap_report.pdf", "PDF"),
+    "presentation": (Path("presentations/executive_presentation.md"), "text/markdown",
+                     "executive_presentation.md", "Presentation"),
+    "dashboard": (Path("dashboards/dashboard_specifications.json"), "application/json",
+                  "dashboard_specs.json", "Dashboard specs"),
+    "pptx": (Path("presentations/executive_presentation.pptx"),
+             "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+             "executive_presentation.pptx", "PPTX"),
+}
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip (q > 0, explicitly or via *)"""
+    qualities: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qualities[coding] = q
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in qualities:
+            return qualities[coding] > 0
+    return False
+
+
+@app.get("/download/{kind}")
+async def download(kind: str, request: Request):
+    """
+    Download a generated artifact
+    
+    kind is one of: report, pdf, presentation, dashboard, pptx.
+    Answers If-Modified-Since with 304 when the file is unchanged.
+    """
+    meta = _DOWNLOADS.get(kind)
+    if meta is None:
+        raise HTTPException(status_code=404, detail=f"Unknown download '{kind}'.")
+    
+    path, media_type, filename, label = meta
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=f"{label} not found. Run analysis first.")
+    
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            since = None
+        if since is not None and int(st.st_mtime) <= since:
+            return Response(status_code=304)
+    
+    # Serve a precompressed sibling (e.g. the dashboard specs' .gz) when the
+    # client accepts gzip and it is at least as new as the file
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        try:
+            gz_st = os.stat(f"{path}.gz")
+        except FileNotFoundError:
+            gz_st = None
+        if gz_st is not None and gz_st.st_mtime >= st.st_mtime:
+            return FileResponse(
+                f"{path}.gz", media_type=media_type, filename=filename, stat_result=gz_st,
+                headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+            )
+    
+    # Passing stat_result saves Starlette a second stat before sendfile
+    return FileResponse(path, media_type=media_type, filename=filename, stat_result=st)
+
+
+# Output folders listed by /outputs, with the filename pattern for each
+_OUTPUT_DIRS = (
+    ("reports", "*.md"),
+    ("presentations", "*"),
+    ("dashboards", "*.json"),
+    ("models", "*.json"),
+)
+_OUTPUT_TTL = 1.0  # seconds; outputs only change when a /run job completes
+_output_cache: Dict[str, Any] = {"t": 0.0, "v": None}
+
+
+def _snapshot_outputs() -> Dict[str, List[str]]:
+    """List output file names per folder with a single scandir each"""
+    snapshot = {}
+    for folder, pattern in _OUTPUT_DIRS:
+        try:
+            with os.scandir(folder) as it:
+                snapshot[folder] = [e.name for e in it if fnmatch(e.name, pattern)]
+        except FileNotFoundError:
+            snapshot[folder] = []
+    return snapshot
 
 
 @app.get("/outputs")
 async def list_outputs():
     """List all available output files"""
-    outputs = {
-        "reports": list(Path("reports").glob("*.md")) if Path("reports").exists() else [],
-        "presentations": list(Path("presentations").glob("*")) if Path("presentations").exists() else [],
-        "dashboards": list(Path("dashboards").glob("*.json")) if Path("dashboards").exists() else [],
-        "models": list(Path("models").glob("*.json")) if Path("models").exists() else [],
-    }
+    now = time.monotonic()
+    if _output_cache["v"] is not None and now - _output_cache["t"] < _OUTPUT_TTL:
+        return _output_cache["v"]
     
-    return {
-        "available_files": {
-            "reports": [f.name for f in outputs["reports"]],
-            "presentations": [f.name for f in outputs["presentations"]],
-            "dashboards": [f.name for f in outputs["dashboards"]],
-            "models": [f.name for f in outputs["models"]],
-        },
+    payload = {
+        "available_files": _snapshot_outputs(),
         "download_urls": {
             "report_md": "/download/report",
             "report_pdf": "/download/pdf",
@@ -381,8 +911,27 @@ async def list_outputs():
             "dashboard_specs": "/download/dashboard",
         }
     }
+    _output_cache["t"] = now
+    _output_cache["v"] = payload
+    return payload
 
 
 if __name__ == "__main__":
+    if _API_WORKERS > 1:
+        # Multiple worker processes; --preload imports the app once and shares
+        # its code pages with the forked workers
+        os.execvp("gunicorn", [
+            "gunicorn", "api_server:app",
+            "-k", "uvicorn.workers.UvicornWorker",
+            "-w", str(_API_WORKERS),
+            "--preload",
+            "-b", "0.0.0.0:8000",
+        ])
+    
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info")
+    uvicorn.run(
+        app, host="0.0.0.0", port=8000, log_level="info",
+        # uvloop is not available on Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
+    )
@@ -4,15 +4,32 @@ Provides real-time visualizations of analysis results using Plotly Dash
 """
 
 import dash
-from dash import dcc, html, Input, Output, State
+from dash import dcc, html, dash_table, ctx, Input, Output, State, Patch
+from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
+from flask_caching import Cache
 import plotly.graph_objects as go
-import plotly.express as px
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
+import hashlib
+import heapq
 import json
 import os
+import threading
+import time
 from pathlib import Path
-import pandas as pd
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = lambda obj: orjson.dumps(obj).decode()
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
 
 # Initialize Dash app with Bootstrap theme
 app = dash.Dash(
@@ -23,6 +40,21 @@ app = dash.Dash(
 
 app.title = "Content Gap Analysis Dashboard"
 
+# WSGI entry point for gunicorn (dashboard_app:server)
+server = app.server
+
+# Worker processes / threads per worker when served by gunicorn
+_DASH_WORKERS = int(os.getenv('DASH_WORKERS', '1'))
+_DASH_THREADS = int(os.getenv('DASH_THREADS', '8'))
+
+# Rendered outputs shared across workers and browser sessions, keyed by data version
+cache = Cache(app.server, config={
+    'CACHE_TYPE': 'FileSystemCache',
+    'CACHE_DIR': os.getenv('DASH_CACHE_DIR', '.dash_cache'),
+    'CACHE_DEFAULT_TIMEOUT': 3600,
+    'CACHE_THRESHOLD': 16
+})
+
 # Color scheme
 COLORS = {
     'primary': '#2196F3',
@@ -35,19 +67,196 @@ COLORS = {
 }
 
 
+# Optional API source for results (e.g. http://api:8000); falls back to the file
+API_URL = os.getenv('CONTENT_GAP_API_URL', '').rstrip('/')
+PACKAGE_PATH = '../content_gap_analysis_package.json'
+
+# Validator (API ETag or file mtime) and parsed package from the last load
+_ETAG = {'tag': None, 'data': None}
+
+_LOAD_LOCK = threading.RLock()
+
+# Keep-alive session so each poll reuses the API connection
+_SESSION = requests.Session()
+_SESSION.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=1))
+_SESSION.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
+
+def _load_from_api():
+    """Fetch /package from the API with a conditional GET; None if it has no results"""
+    headers = {'If-None-Match': _ETAG['tag']} if _ETAG['tag'] else {}
+    response = _SESSION.get(f"{API_URL}/package", headers=headers, timeout=10)
+    
+    if response.status_code == 304:
+        return _ETAG['data']
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    
+    data = _loads(response.content)
+    _ETAG['tag'] = response.headers.get('ETag')
+    _ETAG['data'] = data
+    return data
+
+
 def load_latest_results():
-    """Load the latest analysis results from file"""
-    package_path = '../content_gap_analysis_package.json'
+    """
+    Load the latest analysis results
+    
+    Uses the API when CONTENT_GAP_API_URL is set, otherwise (or if the API has
+    nothing yet) the package file. Unchanged data is not re-downloaded or
+    re-parsed: the API answers 304 to the cached ETag, and the file is only
+    read again when its mtime changes.
+    """
+    # Called from callbacks and the change watcher; keep _ETAG tag/data paired
+    with _LOAD_LOCK:
+        return _load_latest_results()
+
+
+def _load_latest_results():
+    """Unlocked body of load_latest_results"""
+    if API_URL:
+        try:
+            data = _load_from_api()
+            if data is not None:
+                return data
+        except Exception as e:
+            print(f"Error fetching results from API: {e}")
     
-    if not os.path.exists(package_path):
+    try:
+        tag = f"mtime-{os.stat(PACKAGE_PATH).st_mtime_ns}"
+    except OSError:
         return None
     
+    if tag == _ETAG['tag']:
+        return _ETAG['data']
+    
     try:
-        with open(package_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(PACKAGE_PATH, 'rb') as f:
+            data = _loads(f.read())
     except Exception as e:
         print(f"Error loading results: {e}")
         return None
+    
+    _ETAG['tag'] = tag
+    _ETAG['data'] = data
+    return data
+
+
+# Parsed package shared by all callbacks; the data-store only carries its version
+_CACHE = {'hash': None, 'data': None}
+
+# Refreshes this soon after the last fetch reuse its result
+_FETCH_DEBOUNCE_SECONDS = 2
+_LAST_FETCH = {'time': 0.0}
+
+
+# Per-record fields the charts and table read, with their display defaults
+_GAP_DEFAULTS = {'gap_type': 'unknown', 'impact_score': 0}
+_RECOMMENDATION_DEFAULTS = {
+    'title': 'N/A',
+    'impact_score': 0,
+    'difficulty': 'N/A',
+    'publish_priority': 'N/A',
+    'intent': 'N/A'
+}
+
+
+def _normalize_records(data):
+    """Fill missing or null record fields once per package so renders can index directly"""
+    for gap in data.get('gaps', []):
+        for key, default in _GAP_DEFAULTS.items():
+            if gap.get(key) is None:
+                gap[key] = default
+    for rec in data.get('recommendations', []):
+        for key, default in _RECOMMENDATION_DEFAULTS.items():
+            if rec.get(key) is None:
+                rec[key] = default
+
+
+def _data_version(data):
+    """Stable short hash of a results package"""
+    return hashlib.blake2b(_dumps(data).encode('utf-8'), digest_size=8).hexdigest()
+
+
+def refresh_cache():
+    """Load the latest results into _CACHE; returns the current version hash"""
+    data = load_latest_results()
+    _LAST_FETCH['time'] = time.monotonic()
+    with _LOAD_LOCK:
+        # load_latest_results returns the same object while the data is unchanged
+        if data and data is not _CACHE['data']:
+            _normalize_records(data)
+            _CACHE['data'] = data
+            _CACHE['hash'] = _data_version(data)
+        return _CACHE['hash'] if data else None
+
+
+def get_cached_data(version):
+    """Return the parsed package for a data-store version, reloading on a miss"""
+    if not version:
+        return None
+    
+    if version != _CACHE['hash']:
+        # Another process published this version (or the cache was reset)
+        if not refresh_cache():
+            return None
+    
+    return _CACHE['data']
+
+
+def _cache_snapshot():
+    """Return the cached (version, data) pair, read together"""
+    with _LOAD_LOCK:
+        return _CACHE['hash'], _CACHE['data']
+
+
+# Change watcher: a background thread keeps _CACHE current, so the browser's
+# interval tick is only a cheap in-memory version comparison
+_WATCH_INTERVAL_SECONDS = 5
+
+# Browser version-check tick. Each tick is a callback request per open tab,
+# so it stays long; the refresh button covers anyone who can't wait
+_CLIENT_POLL_SECONDS = 30
+_watcher = {'thread': None}
+
+
+def _watch_api_events():
+    """Refresh the cache whenever the API reports a job state change (SSE)"""
+    while True:
+        try:
+            # Separate connection: this stream stays open indefinitely
+            with requests.get(f"{API_URL}/events", stream=True, timeout=(5, 60)) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line.startswith(b'data:'):
+                        continue
+                    event = _loads(line[5:])
+                    if event.get('state') == 'connected' or event.get('status') == 'completed':
+                        refresh_cache()
+        except Exception:
+            # API unavailable: the file fallback may still change
+            refresh_cache()
+        time.sleep(_WATCH_INTERVAL_SECONDS)
+
+
+def _watch_package_file():
+    """Refresh the cache when the package file changes (mtime-guarded, cheap)"""
+    while True:
+        refresh_cache()
+        time.sleep(_WATCH_INTERVAL_SECONDS)
+
+
+def ensure_change_watcher():
+    """Start the change watcher for this process (lazily, so it survives forking servers)"""
+    thread = _watcher['thread']
+    if thread is not None and thread.is_alive():
+        return
+    with _LOAD_LOCK:
+        if _watcher['thread'] is None or not _watcher['thread'].is_alive():
+            target = _watch_api_events if API_URL else _watch_package_file
+            _watcher['thread'] = threading.Thread(target=target, name="results-watcher", daemon=True)
+            _watcher['thread'].start()
 
 
 def create_header():
@@ -133,10 +342,8 @@ def create_gap_distribution_chart(gaps):
     if not gaps:
         return go.Figure().add_annotation(text="No data available", showarrow=False)
     
-    gap_types = {}
-    for gap in gaps:
-        gap_type = gap.get('gap_type', 'unknown')
-        gap_types[gap_type] = gap_types.get(gap_type, 0) + 1
+    # Counter keeps first-seen order, so slice colors stay stable
+    gap_types = Counter(gap['gap_type'] for gap in gaps)
     
     fig = go.Figure(data=[go.Pie(
         labels=[gt.replace('-', ' ').title() for gt in gap_types.keys()],
@@ -159,7 +366,9 @@ def create_impact_score_chart(gaps):
     if not gaps:
         return go.Figure().add_annotation(text="No data available", showarrow=False)
     
-    impact_scores = [g.get('impact_score', 0) for g in gaps]
+    impact_scores = np.fromiter(
+        (g['impact_score'] for g in gaps), dtype=np.float32, count=len(gaps)
+    )
     
     fig = go.Figure(data=[go.Histogram(
         x=impact_scores,
@@ -184,20 +393,17 @@ def create_recommendations_timeline(recommendations):
     if not recommendations:
         return go.Figure().add_annotation(text="No data available", showarrow=False)
     
-    # Convert to DataFrame
-    df = pd.DataFrame(recommendations)
-    
-    # Group by publish priority (date)
-    df['publish_date'] = pd.to_datetime(df['publish_priority'])
-    df['month'] = df['publish_date'].dt.to_period('M').astype(str)
-    
-    monthly_counts = df.groupby('month').size().reset_index(name='count')
+    # Group by publish month; publish_priority is an ISO date, so the
+    # first 7 characters are the YYYY-MM period
+    monthly = Counter(rec['publish_priority'][:7] for rec in recommendations)
+    months = sorted(monthly)
+    counts = [monthly[m] for m in months]
     
     fig = go.Figure(data=[go.Bar(
-        x=monthly_counts['month'],
-        y=monthly_counts['count'],
+        x=months,
+        y=counts,
         marker=dict(color=COLORS['success']),
-        text=monthly_counts['count'],
+        text=counts,
         textposition='auto'
     )])
     
@@ -211,16 +417,25 @@ def create_recommendations_timeline(recommendations):
     return fig
 
 
+# Difficulty labels in x-axis order
+_DIFFICULTY_LEVELS = {'low': 1, 'medium': 2, 'high': 3}
+
+
 def create_difficulty_breakdown(recommendations):
     """Create difficulty vs impact scatter plot"""
     if not recommendations:
         return go.Figure().add_annotation(text="No data available", showarrow=False)
     
+    # Deferred: the only chart needing pandas / plotly.express, so workers
+    # don't pay their import time and memory until it is first rendered
+    import pandas as pd
+    import plotly.express as px
+    
     df = pd.DataFrame(recommendations)
     
-    # Map difficulty to numeric
-    difficulty_map = {'low': 1, 'medium': 2, 'high': 3}
-    df['difficulty_num'] = df['difficulty'].map(difficulty_map)
+    # Map difficulty to its axis position; anything else ('N/A' and other
+    # unknown labels) maps to NaN, which the scatter leaves unplotted
+    df['difficulty_num'] = df['difficulty'].map(_DIFFICULTY_LEVELS).astype(float)
     
     fig = px.scatter(
         df,
@@ -308,39 +523,42 @@ def create_top_recommendations_table(recommendations):
         return html.Div("No recommendations available", className="alert alert-info")
     
     # Get top 10
-    top_recs = sorted(recommendations, key=lambda x: x.get('impact_score', 0), reverse=True)[:10]
-    
-    rows = []
-    for i, rec in enumerate(top_recs, 1):
-        difficulty_color = {
-            'low': 'success',
-            'medium': 'warning',
-            'high': 'danger'
-        }.get(rec.get('difficulty', 'medium'), 'secondary')
-        
-        rows.append(html.Tr([
-            html.Td(str(i)),
-            html.Td(rec.get('title', 'N/A')),
-            html.Td([
-                dbc.Badge(str(rec.get('impact_score', 0)), color="primary", className="me-1"),
-                html.Small(f"/100", className="text-muted")
-            ]),
-            html.Td(dbc.Badge(rec.get('difficulty', 'N/A').title(), color=difficulty_color)),
-            html.Td(rec.get('publish_priority', 'N/A')),
-            html.Td(rec.get('intent', 'N/A').title())
-        ]))
-    
-    table = dbc.Table([
-        html.Thead(html.Tr([
-            html.Th("#"),
-            html.Th("Title"),
-            html.Th("Impact"),
-            html.Th("Difficulty"),
-            html.Th("Target Date"),
-            html.Th("Intent")
-        ])),
-        html.Tbody(rows)
-    ], bordered=True, hover=True, responsive=True, striped=True)
+    top_recs = heapq.nlargest(10, recommendations, key=lambda x: x['impact_score'])
+    
+    # Plain row dicts; the DataTable renders them client-side
+    data = [
+        {
+            '#': i,
+            'Title': rec['title'],
+            'Impact': f"{rec['impact_score']}/100",
+            'Difficulty': rec['difficulty'].title(),
+            'Target Date': rec['publish_priority'],
+            'Intent': rec['intent'].title()
+        }
+        for i, rec in enumerate(top_recs, 1)
+    ]
+    
+    difficulty_colors = {'Low': COLORS['success'], 'Medium': COLORS['warning'], 'High': COLORS['danger']}
+    
+    table = dash_table.DataTable(
+        data=data,
+        columns=[{'name': c, 'id': c} for c in data[0]],
+        style_as_list_view=True,
+        style_header={'fontWeight': 'bold', 'backgroundColor': COLORS['light']},
+        style_cell={'textAlign': 'left', 'padding': '8px', 'fontFamily': 'inherit'},
+        style_data={'whiteSpace': 'normal', 'height': 'auto'},
+        style_data_conditional=[
+            {'if': {'row_index': 'odd'}, 'backgroundColor': '#FAFAFA'},
+            {'if': {'column_id': 'Impact'}, 'color': COLORS['primary'], 'fontWeight': 'bold'}
+        ] + [
+            {
+                'if': {'filter_query': f'{{Difficulty}} = "{level}"', 'column_id': 'Difficulty'},
+                'color': color,
+                'fontWeight': 'bold'
+            }
+            for level, color in difficulty_colors.items()
+        ]
+    )
     
     return dbc.Card([
         dbc.CardHeader([
@@ -359,6 +577,9 @@ app.layout = html.Div([
         # Hidden div for storing data
         html.Div(id='data-store', style={'display': 'none'}),
         
+        # Version and trace shape of the figures currently in the browser
+        dcc.Store(id='rendered-version'),
+        
         # Last updated timestamp
         html.Div(id='last-updated', className="text-muted mb-3"),
         
@@ -409,8 +630,8 @@ app.layout = html.Div([
         ], className="mt-5 mb-3")
     ], fluid=True),
     
-    # Auto-refresh interval (30 seconds)
-    dcc.Interval(id='interval-component', interval=30*1000, n_intervals=0)
+    # Version check interval; only re-renders when the watcher saw new data
+    dcc.Interval(id='interval-component', interval=_CLIENT_POLL_SECONDS*1000, n_intervals=0)
 ])
 
 
@@ -422,11 +643,26 @@ app.layout = html.Div([
     [
         Input('refresh-button', 'n_clicks'),
         Input('interval-component', 'n_intervals')
-    ]
+    ],
+    State('data-store', 'children')
 )
-def update_data(n_clicks, n_intervals):
-    """Load and update data"""
-    data = load_latest_results()
+def update_data(n_clicks, n_intervals, current_version):
+    """Publish a new data version when results change (or on manual refresh)"""
+    ensure_change_watcher()
+    
+    if ctx.triggered_id == 'interval-component':
+        # The watcher keeps _CACHE current; an unchanged version costs nothing
+        if _CACHE['hash'] == current_version:
+            raise PreventUpdate
+        version = _CACHE['hash']
+    elif time.monotonic() - _LAST_FETCH['time'] < _FETCH_DEBOUNCE_SECONDS:
+        # Click burst, or the watcher fetched moments ago: reuse that result
+        version = _CACHE['hash']
+    else:
+        # Initial load or refresh button
+        version = refresh_cache()
+    
+    data = _CACHE['data'] if version else None
     
     if data:
         metadata = data.get('metadata', {})
@@ -434,7 +670,7 @@ def update_data(n_clicks, n_intervals):
             html.I(className="fas fa-clock me-2"),
             f"Last Updated: {metadata.get('report_generated', 'N/A')} • ",
             html.I(className="fas fa-sync-alt me-2 ms-3"),
-            f"Auto-refresh every 30s"
+            "Live updates"
         ])
     else:
         last_updated = html.Div([
@@ -442,99 +678,140 @@ def update_data(n_clicks, n_intervals):
             "No analysis data available. Run the analysis pipeline first."
         ], className="alert alert-info")
     
-    return json.dumps(data) if data else None, last_updated
+    return version, last_updated
 
 
 @app.callback(
-    Output('summary-cards', 'children'),
-    Input('data-store', 'children')
-)
-def update_summary_cards(data_json):
-    """Update summary cards"""
-    if not data_json:
-        return html.Div("Loading...", className="alert alert-info")
-    
-    data = json.loads(data_json)
-    return create_summary_cards(data)
-
-
-@app.callback(
-    Output('model-metrics', 'children'),
-    Input('data-store', 'children')
-)
-def update_model_metrics(data_json):
-    """Update model metrics card"""
-    if not data_json:
-        return None
-    
-    data = json.loads(data_json)
-    return create_model_metrics_card(data.get('model_metrics'))
-
-
-@app.callback(
-    Output('gap-distribution-chart', 'figure'),
-    Input('data-store', 'children')
-)
-def update_gap_chart(data_json):
-    """Update gap distribution chart"""
-    if not data_json:
-        return go.Figure().add_annotation(text="Loading...", showarrow=False)
-    
-    data = json.loads(data_json)
-    return create_gap_distribution_chart(data.get('gaps', []))
-
-
-@app.callback(
-    Output('impact-score-chart', 'figure'),
-    Input('data-store', 'children')
-)
-def update_impact_chart(data_json):
-    """Update impact score chart"""
-    if not data_json:
-        return go.Figure().add_annotation(text="Loading...", showarrow=False)
-    
-    data = json.loads(data_json)
-    return create_impact_score_chart(data.get('gaps', []))
-
-
-@app.callback(
-    Output('timeline-chart', 'figure'),
-    Input('data-store', 'children')
+    [
+        Output('summary-cards', 'children'),
+        Output('model-metrics', 'children'),
+        Output('gap-distribution-chart', 'figure'),
+        Output('impact-score-chart', 'figure'),
+        Output('timeline-chart', 'figure'),
+        Output('difficulty-chart', 'figure'),
+        Output('top-recommendations-table', 'children'),
+        Output('rendered-version', 'data')
+    ],
+    Input('data-store', 'children'),
+    State('rendered-version', 'data')
 )
-def update_timeline_chart(data_json):
-    """Update timeline chart"""
-    if not data_json:
-        return go.Figure().add_annotation(text="Loading...", showarrow=False)
-    
-    data = json.loads(data_json)
-    return create_recommendations_timeline(data.get('recommendations', []))
+def update_dashboard(data_version, rendered):
+    """Rebuild all cards, charts and tables from one read of the package"""
+    data = get_cached_data(data_version)
+    if not data:
+        return (*_loading_outputs(), None)
+    
+    if rendered and rendered['version'] == data_version:
+        # Refresh of an unchanged package; the browser is already current
+        raise PreventUpdate
+    
+    outputs = list(render_dashboard(data_version))
+    shape = {
+        'version': data_version,
+        'gaps': bool(data.get('gaps')),
+        'recommendations': bool(data.get('recommendations'))
+    }
+    
+    # When the browser already holds the same traces, only their arrays
+    # change: send a Patch for the histogram and timeline, not full figures
+    if rendered:
+        if rendered['gaps'] and shape['gaps']:
+            outputs[3] = _patch_trace(outputs[3], 'x')
+        if rendered['recommendations'] and shape['recommendations']:
+            outputs[4] = _patch_trace(outputs[4], 'x', 'y', 'text')
+    
+    return (*outputs, shape)
+
+
+def _patch_trace(figure, *keys):
+    """Partial update replacing the given keys of a figure's first trace"""
+    patched = Patch()
+    for key in keys:
+        patched['data'][0][key] = figure['data'][0][key]
+    return patched
+
+
+def _loading_outputs():
+    """Placeholder dashboard outputs shown while no package is available"""
+    loading = go.Figure().add_annotation(text="Loading...", showarrow=False).to_dict()
+    return (
+        html.Div("Loading...", className="alert alert-info"),
+        None,
+        loading,
+        loading,
+        loading,
+        loading,
+        None
+    )
 
 
-@app.callback(
-    Output('difficulty-chart', 'figure'),
-    Input('data-store', 'children')
-)
-def update_difficulty_chart(data_json):
-    """Update difficulty chart"""
-    if not data_json:
-        return go.Figure().add_annotation(text="Loading...", showarrow=False)
+class _VersionMismatch(Exception):
+    """The cache no longer holds the requested version; carries what it holds"""
     
-    data = json.loads(data_json)
-    return create_difficulty_breakdown(data.get('recommendations', []))
+    def __init__(self, data):
+        super().__init__()
+        self.data = data
 
 
-@app.callback(
-    Output('top-recommendations-table', 'children'),
-    Input('data-store', 'children')
-)
-def update_recommendations_table(data_json):
-    """Update recommendations table"""
-    if not data_json:
-        return None
+def render_dashboard(data_version):
+    """Build every dashboard output for a data version"""
+    try:
+        return _render_version(data_version)
+    except _VersionMismatch as mismatch:
+        # Raised out of the memoized build so nothing is cached under a
+        # version the outputs were not built from
+        if mismatch.data is None:
+            return _loading_outputs()
+        return _build_dashboard(mismatch.data)
+
+
+@lru_cache(maxsize=4)
+@cache.memoize()
+def _render_version(data_version):
+    """
+    Memoized dashboard outputs for a data version
+    
+    Figures are deterministic in the data, so repeat renders of an
+    unchanged package (page loads, refresh clicks, other browser sessions)
+    reuse the built components and figure dicts. The lru_cache serves hits
+    in-process; the filesystem cache lets other workers skip the build for
+    a version one of them already rendered.
+    """
+    get_cached_data(data_version)
+    version, data = _cache_snapshot()
+    if data is None or version != data_version:
+        raise _VersionMismatch(data)
+    return _build_dashboard(data)
+
+
+def _build_dashboard(data):
+    """Build every dashboard output from a results package"""
+    gaps = data.get('gaps', [])
+    recommendations = data.get('recommendations', [])
     
-    data = json.loads(data_json)
-    return create_top_recommendations_table(data.get('recommendations', []))
+    return (
+        create_summary_cards(data),
+        create_model_metrics_card(data.get('model_metrics')),
+        create_gap_distribution_chart(gaps).to_dict(),
+        create_impact_score_chart(gaps).to_dict(),
+        create_recommendations_timeline(recommendations).to_dict(),
+        create_difficulty_breakdown(recommendations).to_dict(),
+        create_top_recommendations_table(recommendations)
+    )
 
 
 if __name__ == '__main__':
+    if _DASH_WORKERS > 1:
+        # Threaded gunicorn workers so concurrent sessions' callbacks don't
+        # queue behind each other on the single-threaded dev server
+        os.execvp('gunicorn', [
+            'gunicorn', 'dashboard_app:server',
+            '-k', 'gthread',
+            '-w', str(_DASH_WORKERS),
+            '--threads', str(_DASH_THREADS),
+            '--timeout', '60',
+            '--preload',
+            '-b', '0.0.0.0:8050',
+        ])
+    
     app.run(host='0.0.0.0', port=8050, debug=True)
@@ -3,18 +3,82 @@ Content Gap Analysis - Interactive Dashboard Specifications
 JSON specifications for 5 dashboard visualizations with complete encoding details
 """
 
+import gzip
 import json
-from typing import Dict, Any
+import os
+import tempfile
+from functools import lru_cache
+from typing import Dict, Any, Optional
+
+try:
+    import orjson
+    
+    def _encode_specs(specs, indent=True):
+        return orjson.dumps(specs, option=orjson.OPT_INDENT_2 if indent else None)
+except ImportError:
+    def _encode_specs(specs, indent=True):
+        if indent:
+            return json.dumps(specs, indent=2, ensure_ascii=False).encode('utf-8')
+        return json.dumps(specs, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+# Palettes shared by several specs (read-only)
+GAP_TYPE_COLORS = {
+    "missing": "#e74c3c",
+    "thin": "#f39c12",
+    "outdated": "#3498db",
+    "under-optimized": "#9b59b6"
+}
+
+# Metric card colors: strict for the headline metric, amber warning otherwise
+STRICT_THRESHOLD_COLORS = {"above_threshold": "#27ae60", "below_threshold": "#e74c3c"}
+THRESHOLD_COLORS = {"above_threshold": "#27ae60", "below_threshold": "#f39c12"}
+
+
+# Model metric cards: (title, field, threshold, colors, subtitle, icon)
+_METRIC_CARDS = (
+    ("Accuracy", "accuracy", 0.80, STRICT_THRESHOLD_COLORS,
+     "Overall Classification Accuracy", "✓"),
+    ("Precision (Macro)", "precision", 0.75, THRESHOLD_COLORS,
+     "Average Precision Across Classes", None),
+    ("Recall (Macro)", "recall", 0.75, THRESHOLD_COLORS,
+     "Average Recall Across Classes", None),
+    ("F1 Score (Macro)", "f1_macro", 0.75, THRESHOLD_COLORS,
+     "Harmonic Mean of Precision & Recall", None),
+)
+
+
+def _metric_card(title, field, threshold, colors, subtitle, icon):
+    """Build one metric card spec"""
+    card = {
+        "title": title,
+        "field": field,
+        "format": ".2%",
+        "threshold": threshold,
+        "color_encoding": colors
+    }
+    if icon:
+        card["icon"] = icon
+    card["subtitle"] = subtitle
+    return card
 
 
 class DashboardSpecGenerator:
-    """Generates JSON specifications for interactive dashboards"""
+    """
+    Generates JSON specifications for interactive dashboards
+    
+    The specs are constants, so each generator builds its dict once per
+    process and returns that same object afterwards; callers must treat
+    the returned specs as read-only.
+    """
     
     def __init__(self):
         """Initialize dashboard spec generator"""
         pass
     
-    def generate_gap_table_spec(self) -> Dict[str, Any]:
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def generate_gap_table_spec() -> Dict[str, Any]:
         """
         Specification for interactive gap analysis table
         Shows all identified gaps with filtering and sorting capabilities
@@ -40,12 +104,7 @@ class DashboardSpecGenerator:
                     "width": "120px",
                     "sortable": True,
                     "filterable": True,
-                    "color_encoding": {
-                        "missing": "#e74c3c",
-                        "thin": "#f39c12",
-                        "outdated": "#3498db",
-                        "under-optimized": "#9b59b6"
-                    }
+                    "color_encoding": GAP_TYPE_COLORS
                 },
                 {
                     "field": "impact_score",
@@ -110,7 +169,9 @@ class DashboardSpecGenerator:
             }
         }
     
-    def generate_topic_heatmap_spec(self) -> Dict[str, Any]:
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def generate_topic_heatmap_spec() -> Dict[str, Any]:
         """
         Specification for topic coverage heatmap
         Visualizes topic overlap between your content and competitors
@@ -182,7 +243,9 @@ class DashboardSpecGenerator:
             }
         }
     
-    def generate_impact_chart_spec(self) -> Dict[str, Any]:
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def generate_impact_chart_spec() -> Dict[str, Any]:
         """
         Specification for impact vs difficulty scatter plot
         Helps prioritize content based on ROI potential
@@ -223,8 +286,8 @@ class DashboardSpecGenerator:
                     "field": "gap_type",
                     "type": "nominal",
                     "scale": {
-                        "domain": ["missing", "thin", "outdated", "under-optimized"],
-                        "range": ["#e74c3c", "#f39c12", "#3498db", "#9b59b6"]
+                        "domain": list(GAP_TYPE_COLORS),
+                        "range": list(GAP_TYPE_COLORS.values())
                     },
                     "legend": {
                         "title": "Gap Type"
@@ -283,7 +346,9 @@ class DashboardSpecGenerator:
             }
         }
     
-    def generate_model_metrics_spec(self) -> Dict[str, Any]:
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def generate_model_metrics_spec() -> Dict[str, Any]:
         """
         Specification for ML model performance dashboard
         Shows precision, recall, F1, confusion matrix
@@ -297,53 +362,7 @@ class DashboardSpecGenerator:
                 {
                     "component_type": "metric_cards",
                     "layout": "horizontal",
-                    "cards": [
-                        {
-                            "title": "Accuracy",
-                            "field": "accuracy",
-                            "format": ".2%",
-                            "threshold": 0.80,
-                            "color_encoding": {
-                                "above_threshold": "#27ae60",
-                                "below_threshold": "#e74c3c"
-                            },
-                            "icon": "✓",
-                            "subtitle": "Overall Classification Accuracy"
-                        },
-                        {
-                            "title": "Precision (Macro)",
-                            "field": "precision",
-                            "format": ".2%",
-                            "threshold": 0.75,
-                            "color_encoding": {
-                                "above_threshold": "#27ae60",
-                                "below_threshold": "#f39c12"
-                            },
-                            "subtitle": "Average Precision Across Classes"
-                        },
-                        {
-                            "title": "Recall (Macro)",
-                            "field": "recall",
-                            "format": ".2%",
-                            "threshold": 0.75,
-                            "color_encoding": {
-                                "above_threshold": "#27ae60",
-                                "below_threshold": "#f39c12"
-                            },
-                            "subtitle": "Average Recall Across Classes"
-                        },
-                        {
-                            "title": "F1 Score (Macro)",
-                            "field": "f1_macro",
-                            "format": ".2%",
-                            "threshold": 0.75,
-                            "color_encoding": {
-                                "above_threshold": "#27ae60",
-                                "below_threshold": "#f39c12"
-                            },
-                            "subtitle": "Harmonic Mean of Precision & Recall"
-                        }
-                    ]
+                    "cards": [_metric_card(*card) for card in _METRIC_CARDS]
                 },
                 {
                     "component_type": "confusion_matrix",
@@ -420,7 +439,9 @@ class DashboardSpecGenerator:
             }
         }
     
-    def generate_timeline_spec(self) -> Dict[str, Any]:
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def generate_timeline_spec() -> Dict[str, Any]:
         """
         Specification for content publication timeline
         Shows recommended publication schedule over 90 days
@@ -461,8 +482,8 @@ class DashboardSpecGenerator:
                     "field": "gap_type",
                     "type": "nominal",
                     "scale": {
-                        "domain": ["missing", "thin", "outdated", "under-optimized"],
-                        "range": ["#e74c3c", "#f39c12", "#3498db", "#9b59b6"]
+                        "domain": list(GAP_TYPE_COLORS),
+                        "range": list(GAP_TYPE_COLORS.values())
                     },
                     "legend": {
                         "title": "Gap Type"
@@ -523,17 +544,107 @@ class DashboardSpecGenerator:
             }
         }
     
-    def generate_all_specs(self) -> Dict[str, Any]:
+    @classmethod
+    @lru_cache(maxsize=1)
+    def generate_all_specs(cls) -> Dict[str, Any]:
         """Generate all dashboard specifications"""
         
         return {
-            "gap_table": self.generate_gap_table_spec(),
-            "topic_heatmap": self.generate_topic_heatmap_spec(),
-            "impact_chart": self.generate_impact_chart_spec(),
-            "model_metrics": self.generate_model_metrics_spec(),
-            "timeline": self.generate_timeline_spec()
+            "gap_table": cls.generate_gap_table_spec(),
+            "topic_heatmap": cls.generate_topic_heatmap_spec(),
+            "impact_chart": cls.generate_impact_chart_spec(),
+            "model_metrics": cls.generate_model_metrics_spec(),
+            "timeline": cls.generate_timeline_spec()
         }
 
+    
+    @classmethod
+    def get_spec(cls, name: str) -> Dict[str, Any]:
+        """Return a single dashboard specification by name (e.g. 'gap_table')"""
+        return cls.generate_all_specs()[name]
+
+
+@lru_cache(maxsize=None)
+def spec_json_bytes(name: Optional[str] = None) -> bytes:
+    """
+    Minified JSON for all specs, or for one spec by name
+    
+    Encoded once per process, so HTTP handlers can return the bytes as-is.
+    """
+    specs = DashboardSpecGenerator.generate_all_specs()
+    return _encode_specs(specs if name is None else specs[name], indent=False)
+
+
+# Top-level keys every dashboard spec must carry
+_REQUIRED_SPEC_KEYS = ("chart_type", "title", "description", "data_source")
+
+
+def validate_specs(dashboard_specs: Dict[str, Any]) -> None:
+    """
+    Check the specs' required structure; raises ValueError listing every problem
+    
+    The specs are static, so this runs when they are generated (main()), not
+    when they are served.
+    """
+    problems = []
+    for name, spec in dashboard_specs.items():
+        if not isinstance(spec, dict):
+            problems.append(f"{name}: spec is not an object")
+            continue
+        for key in _REQUIRED_SPEC_KEYS:
+            if not isinstance(spec.get(key), str) or not spec[key]:
+                problems.append(f"{name}: missing or empty '{key}'")
+    
+    if problems:
+        raise ValueError("Invalid dashboard specifications:\n  " + "\n  ".join(problems))
+
+
+def write_specs(dashboard_specs: Dict[str, Any], output_file: str) -> bool:
+    """
+    Write dashboard specs as indented UTF-8 JSON
+    
+    The specs are static, so the file is only rewritten when its content
+    would change; an existing artifact keeps its mtime (and so stays
+    cacheable by HTTP clients). A gzip copy is written next to it as
+    <output_file>.gz. Both are published with os.replace, so readers never
+    see a partially written file. Returns True if the files were written.
+    """
+    content = _encode_specs(dashboard_specs)
+    gz_file = output_file + '.gz'
+    
+    try:
+        if os.path.getsize(output_file) == len(content) and os.path.exists(gz_file):
+            with open(output_file, 'rb') as f:
+                if f.read() == content:
+                    return False
+    except OSError:
+        pass
+    
+    _replace_file(output_file, content)
+    
+    # Precompressed copy for clients sending Accept-Encoding: gzip; mtime=0
+    # keeps the bytes identical across runs. Written second, so it is never
+    # newer than a JSON file it doesn't match
+    _replace_file(gz_file, gzip.compress(content, compresslevel=9, mtime=0))
+    return True
+
+
+def _replace_file(path: str, content: bytes) -> None:
+    """Write content to a temp file and atomically swap it into place"""
+    # A unique temp name per call, so concurrent writers (the pipeline and a
+    # CLI run, or two API workers) never write into each other's temp file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.',
+                                    prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        # mkstemp creates the file 0600; the specs are served and read by others
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
 
 def main():
     """Generate and save dashboard specifications"""
@@ -542,20 +653,26 @@ def main():
     
     # Generate all specs
     dashboard_specs = generator.generate_all_specs()
+    validate_specs(dashboard_specs)
     
     # Save to file
     output_file = 'dashboards/dashboard_specifications.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(dashboard_specs, f, indent=2, ensure_ascii=False)
-    
-    print(f"Dashboard specifications generated: {output_file}")
-    print(f"Total dashboards: {len(dashboard_specs)}")
+    write_specs(dashboard_specs, output_file)
     
+    # Build the summary first and emit it with a single write
+    lines = [
+        f"Dashboard specifications generated: {output_file}",
+        f"Total dashboards: {len(dashboard_specs)}"
+    ]
     for name, spec in dashboard_specs.items():
-        print(f"\n{name}:")
-        print(f"  Type: {spec['chart_type']}")
-        print(f"  Title: {spec['title']}")
-        print(f"  Description: {spec['description'][:100]}...")
+        lines.append(
+            f"\n{name}:\n"
+            f"  Type: {spec['chart_type']}\n"
+            f"  Title: {spec['title']}\n"
+            f"  Description: {spec['description'][:100]}..."
+        )
+    
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
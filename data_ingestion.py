@@ -4,6 +4,7 @@ Extracts text, metadata, keywords, entities from multiple document formats
 """
 
 import json
+import os
 import re
 from datetime import datetime
 from pathlib import Path
@@ -11,45 +12,201 @@ from typing import Dict, List, Any, Optional
 from collections import Counter
 import hashlib
 
+import numpy as np
+
 # Document processing libraries
 try:
     from bs4 import BeautifulSoup
     import nltk
-    from nltk.tokenize import word_tokenize, sent_tokenize
     from nltk.corpus import stopwords
-    from nltk.stem import WordNetLemmatizer
     import spacy
+    from spacy.attrs import IS_SPACE, LEMMA, LOWER
+    from spacy.tokens import Doc
 except ImportError:
     print("Installing required libraries...")
     import subprocess
     subprocess.run(["pip", "install", "beautifulsoup4", "nltk", "spacy"])
+
+try:
+    import orjson
     
+    def _dump_json(obj) -> bytes:
+        """Serialize to indented UTF-8 JSON"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _dump_json(obj) -> bytes:
+        """Serialize to indented UTF-8 JSON"""
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Patterns used on every document, compiled once
+_HEADING_MD_RE = re.compile(r'^#+\s+(.+)$', re.MULTILINE)
+_HEADING_HTML_RE = re.compile(r'<h[1-6]>(.+?)</h[1-6]>', re.IGNORECASE)
+_URL_RE = re.compile(r'https?://[^\s<>"]+|www\.[^\s<>"]+')
+
 
 class DocumentProcessor:
     """Processes documents and extracts comprehensive metadata"""
     
-    def __init__(self):
-        """Initialize NLP components"""
-        # Download NLTK data
+    # spaCy pipeline package used for tokens, lemmas, sentences and entities
+    SPACY_MODEL = 'en_core_web_sm'
+    
+    # Entity types kept in document and corpus metadata
+    ENTITY_LABELS = ('PERSON', 'ORG', 'GPE', 'PRODUCT', 'EVENT', 'DATE')
+    
+    # Minimum corpus size before process_corpus spreads spaCy over processes
+    PARALLEL_MIN_DOCS = 200
+    
+    # Longer texts go through spaCy in chunks of about this many characters
+    CHUNK_CHARS = 100000
+    
+    # JSON files larger than this are streamed with ijson (when installed)
+    JSON_STREAM_BYTES = 50_000_000
+    
+    # Most documents kept in the metadata cache (least recently used are dropped)
+    METADATA_CACHE_SIZE = 4096
+    
+    # Metadata fields that belong to one occurrence of a text, not to the text
+    _PER_SOURCE_FIELDS = ('source', 'timestamp', 'title')
+    
+    def __init__(self, cache_path: Optional[str] = None):
+        """Initialize NLP components (the spaCy model loads on first use)"""
+        # Download NLTK stopwords (tokenizing and lemmatizing is done by spaCy).
+        # This stays eager: other components (e.g. TopicModelingEngine) read
+        # the stopwords corpus right after a DocumentProcessor is built
         try:
-            nltk.data.find('tokenizers/punkt')
+            nltk.data.find('corpora/stopwords')
         except LookupError:
-            nltk.download('punkt')
             nltk.download('stopwords')
-            nltk.download('wordnet')
-            nltk.download('averaged_perceptron_tagger')
         
-        self.lemmatizer = WordNetLemmatizer()
-        self.stop_words = set(stopwords.words('english'))
+        self._nlp = None
+        self._stop_words = None
+        
+        # Parsed JSON of the file read last (for its title)
+        self._current_json_data = None
         
-        # Try to load spaCy model
+        # Metadata of texts processed before, keyed by text hash and length,
+        # so unchanged documents skip spaCy on later runs. Opt-in: only kept
+        # on disk when a cache_path is given, and read on first use
+        self.cache_path = cache_path
+        self._metadata_cache = None
+        self._metadata_cache_dirty = False
+    
+    @property
+    def nlp(self):
+        """The spaCy pipeline, loaded (and downloaded if missing) on first use"""
+        if self._nlp is None:
+            try:
+                self._nlp = self._load_spacy_model()
+            except OSError:
+                print("Downloading spaCy model...")
+                import subprocess
+                subprocess.run(["python", "-m", "spacy", "download", self.SPACY_MODEL])
+                self._nlp = self._load_spacy_model()
+        return self._nlp
+    
+    @property
+    def stop_words(self) -> frozenset:
+        """NLTK English stopwords, as a frozenset built on first use"""
+        if self._stop_words is None:
+            self._stop_words = frozenset(stopwords.words('english'))
+        return self._stop_words
+    
+    @property
+    def _model_id(self) -> str:
+        """Model name and version, read from package metadata without loading it"""
+        version = spacy.util.get_package_version(self.SPACY_MODEL) or self.nlp.meta.get('version')
+        return f"{self.SPACY_MODEL}-{version}"
+    
+    @classmethod
+    def _load_spacy_model(cls):
+        """
+        Load the spaCy pipeline used for tokens, lemmas, sentences and entities
+        
+        The dependency parser is only needed for sentence boundaries, which
+        the rule-based sentencizer provides far more cheaply.
+        """
+        nlp = spacy.load(cls.SPACY_MODEL, disable=['parser'])
+        nlp.add_pipe('sentencizer')
+        return nlp
+    
+    # ----------------------------------------------------------------------------------
+    # Metadata Cache
+    # ----------------------------------------------------------------------------------
+    @property
+    def _cache_entries(self) -> Dict[str, Dict[str, Any]]:
+        """Cached metadata by cache key, loaded from cache_path on first access"""
+        if self._metadata_cache is None:
+            self._metadata_cache = self._load_metadata_cache()
+        return self._metadata_cache
+    
+    def _load_metadata_cache(self) -> Dict[str, Dict[str, Any]]:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
         try:
-            self.nlp = spacy.load('en_core_web_sm')
-        except OSError:
-            print("Downloading spaCy model...")
-            import subprocess
-            subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"])
-            self.nlp = spacy.load('en_core_web_sm')
+            cache = json.loads(Path(self.cache_path).read_bytes())
+        except Exception:
+            return {}
+        # Entries from another spaCy model could differ in lemmas and entities
+        if cache.get('model') != self._model_id:
+            return {}
+        return cache.get('entries', {})
+    
+    def _save_metadata_cache(self):
+        """Write the metadata cache if it changed since the last save"""
+        if not self.cache_path or not self._metadata_cache_dirty:
+            return
+        entries = self._cache_entries
+        if len(entries) > self.METADATA_CACHE_SIZE:
+            # Dict order is least to most recently used
+            entries = dict(list(entries.items())[-self.METADATA_CACHE_SIZE:])
+            self._metadata_cache = entries
+        os.makedirs(os.path.dirname(self.cache_path) or '.', exist_ok=True)
+        Path(self.cache_path).write_bytes(_dump_json({'model': self._model_id, 'entries': entries}))
+        self._metadata_cache_dirty = False
+    
+    @staticmethod
+    def _text_hash(text: str) -> str:
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _cache_key(text: str, text_hash: str) -> str:
+        return f"{text_hash}:{len(text)}"
+    
+    @staticmethod
+    def _copy_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of a metadata dict sharing none of its lists (keywords, entities, ...)"""
+        copied = {}
+        for k, v in metadata.items():
+            if isinstance(v, list):
+                v = list(v)
+            elif isinstance(v, dict):
+                v = {ek: list(ev) if isinstance(ev, list) else ev for ek, ev in v.items()}
+            copied[k] = v
+        return copied
+    
+    def _get_cached_metadata(self, key: str, source: str, title: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Rebuild a document's metadata from the cache, or None on a miss"""
+        entries = self._cache_entries
+        cached = entries.pop(key, None)
+        if cached is None:
+            return None
+        entries[key] = cached  # mark as most recently used
+        metadata = self._copy_metadata(cached)
+        metadata.update(source=source, timestamp=datetime.now().isoformat())
+        if title:
+            metadata['title'] = title
+        return metadata
+    
+    def _cache_metadata(self, key: str, metadata: Dict[str, Any]):
+        self._cache_entries[key] = self._copy_metadata(
+            {k: v for k, v in metadata.items() if k not in self._PER_SOURCE_FIELDS}
+        )
+        self._metadata_cache_dirty = True
     
     def extract_text_from_file(self, file_path: str) -> str:
         """Extract text from various file formats"""
@@ -58,112 +215,197 @@ class DocumentProcessor:
         if not path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        if path.suffix.lower() == '.txt':
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        
-        elif path.suffix.lower() == '.json':
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Extract text from common JSON structures
-                if isinstance(data, dict):
-                    text_parts = []
-                    for key, value in data.items():
-                        if isinstance(value, str):
-                            text_parts.append(value)
-                        elif isinstance(value, list):
-                            text_parts.extend([str(v) for v in value])
-                    # Store the JSON data for later metadata extraction
-                    self._current_json_data = data
-                    return ' '.join(text_parts)
-                elif isinstance(data, list):
-                    self._current_json_data = None
-                    return ' '.join([str(item) for item in data])
-                else:
-                    self._current_json_data = None
-                    return str(data)
+        # Whole-file reads: one read_bytes() and an explicit decode, without
+        # a buffered text wrapper per file
+        suffix = path.suffix.lower()
+        
+        if suffix == '.txt':
+            return path.read_bytes().decode('utf-8')
         
-        elif path.suffix.lower() in ['.html', '.htm']:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                soup = BeautifulSoup(f.read(), 'html.parser')
-                return soup.get_text()
+        elif suffix == '.json':
+            if ijson is not None and path.stat().st_size > self.JSON_STREAM_BYTES:
+                return self._stream_json_text(path)
+            
+            data = json.loads(path.read_bytes())
+            # Extract text from common JSON structures
+            if isinstance(data, dict):
+                text_parts = []
+                for key, value in data.items():
+                    if isinstance(value, str):
+                        text_parts.append(value)
+                    elif isinstance(value, list):
+                        text_parts.extend([str(v) for v in value])
+                # Store the JSON data for later metadata extraction
+                self._current_json_data = data
+                return ' '.join(text_parts)
+            elif isinstance(data, list):
+                self._current_json_data = None
+                return ' '.join([str(item) for item in data])
+            else:
+                self._current_json_data = None
+                return str(data)
         
-        elif path.suffix.lower() == '.md':
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
+        elif suffix in ['.html', '.htm']:
+            # Bytes let BeautifulSoup honour the page's declared charset
+            soup = BeautifulSoup(path.read_bytes(), 'html.parser')
+            return soup.get_text()
+        
+        elif suffix == '.md':
+            return path.read_bytes().decode('utf-8')
         
         else:
             # Default: try to read as text
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                return f.read()
+            return path.read_bytes().decode('utf-8', errors='ignore')
+    
+    def _stream_json_text(self, path: Path) -> str:
+        """
+        Join the string values of a large JSON file without loading its tree
+        
+        Only a top-level "title" is kept for metadata; the rest of the parsed
+        data is never held in memory.
+        """
+        text_parts = []
+        title = None
+        with path.open('rb') as f:
+            for prefix, event, value in ijson.parse(f):
+                if event == 'string':
+                    text_parts.append(value)
+                    if prefix == 'title':
+                        title = value
+        self._current_json_data = {'title': title} if title else None
+        return ' '.join(text_parts)
     
     def extract_metadata(self, text: str, source: str = "unknown") -> Dict[str, Any]:
         """Extract comprehensive metadata from text"""
+        title = self._pop_json_title()
+        text_hash = self._text_hash(text)
+        key = self._cache_key(text, text_hash)
+        metadata = self._get_cached_metadata(key, source, title)
+        if metadata is None:
+            doc = next(self._pipe_texts([text]))
+            metadata = self.extract_metadata_from_doc(doc, text, source, title, text_hash)
+            self._cache_metadata(key, metadata)
+        return metadata
+    
+    def _split_text(self, text: str) -> List[str]:
+        """Split text into chunks of at most CHUNK_CHARS, preferably at paragraph breaks"""
+        if len(text) <= self.CHUNK_CHARS:
+            return [text]
         
-        # Try to get title from JSON data if available
-        title = None
-        if hasattr(self, '_current_json_data') and self._current_json_data:
-            title = self._current_json_data.get('title')
-            self._current_json_data = None  # Clear after use
+        chunks = []
+        start = 0
+        while start < len(text):
+            end = min(start + self.CHUNK_CHARS, len(text))
+            if end < len(text):
+                # Cut after a paragraph break, else after a space, so no
+                # token (or, mostly, sentence) straddles two chunks
+                cut = text.rfind('\n\n', start, end - 1)
+                if cut > start:
+                    end = cut + 2
+                else:
+                    cut = text.rfind(' ', start, end)
+                    if cut > start:
+                        end = cut + 1
+            chunks.append(text[start:end])
+            start = end
+        return chunks
+    
+    def _pipe_texts(self, texts: List[str], n_process: int = 1):
+        """
+        Run texts through spaCy as one batch, yielding one Doc per text
+        
+        Long texts are fed as chunks and merged back with Doc.from_docs, so
+        nothing past spaCy's max_length is dropped and memory stays bounded.
+        """
+        chunked = [self._split_text(text) for text in texts]
+        docs = self.nlp.pipe(
+            (chunk for chunks in chunked for chunk in chunks),
+            batch_size=32,
+            n_process=n_process
+        )
+        for chunks in chunked:
+            parts = [next(docs) for _ in chunks]
+            yield parts[0] if len(parts) == 1 else Doc.from_docs(parts)
+    
+    def _pop_json_title(self) -> Optional[str]:
+        """Return the title of the JSON file read last (if any) and clear it"""
+        data = self._current_json_data
+        self._current_json_data = None
+        return data.get('title') if data else None
+    
+    def extract_metadata_from_doc(self, doc, text: str, source: str = "unknown",
+                                  title: Optional[str] = None,
+                                  text_hash: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Extract comprehensive metadata from a spaCy Doc of text
+        
+        Sentences, tokens, lemmas and entities all come from the one Doc, so
+        the text is tokenized once.
+        """
         
         # Basic statistics
-        sentences = sent_tokenize(text)
-        words = word_tokenize(text.lower())
+        sentence_count = sum(1 for _ in doc.sents)
+        
+        # Filter stopwords and count clean (lemmatized) tokens on the Doc's
+        # attribute array; strings are only looked up once per distinct id
+        strings = doc.vocab.strings
+        arr = doc.to_array([IS_SPACE, LOWER, LEMMA])
+        arr = arr[arr[:, 0] == 0]
+        word_count = len(arr)
         
-        # Filter stopwords and get clean tokens
-        clean_tokens = [
-            self.lemmatizer.lemmatize(word) 
-            for word in words 
-            if word.isalnum() and word not in self.stop_words
-        ]
+        lowers, inverse = np.unique(arr[:, 1], return_inverse=True)
+        keep = np.fromiter(
+            (word.isalnum() and word not in self.stop_words
+             for word in (strings[int(i)] for i in lowers)),
+            dtype=bool, count=len(lowers)
+        )
+        lemma_ids = arr[keep[inverse.ravel()], 2]
+        
+        # Count per lemma in order of first appearance, as Counter over the
+        # token list would, so ties among keywords keep the same order
+        ids, first, counts = np.unique(lemma_ids, return_index=True, return_counts=True)
+        order = np.argsort(first, kind='stable')
+        word_freq = Counter()
+        for lemma_id, count in zip(ids[order].tolist(), counts[order].tolist()):
+            word_freq[strings[lemma_id].lower()] += count
+        token_count = len(lemma_ids)
         
         # Extract keywords (top 20 most common)
-        word_freq = Counter(clean_tokens)
         keywords = [word for word, count in word_freq.most_common(20)]
         
-        # Extract entities using spaCy
-        doc = self.nlp(text[:100000])  # Limit for performance
-        entities = {
-            'PERSON': [],
-            'ORG': [],
-            'GPE': [],
-            'PRODUCT': [],
-            'EVENT': [],
-            'DATE': []
-        }
-        
+        # Extract entities (unique values only)
+        entities = {label: set() for label in self.ENTITY_LABELS}
         for ent in doc.ents:
             if ent.label_ in entities:
-                entities[ent.label_].append(ent.text)
-        
-        # Clean up entities (unique values only)
-        entities = {k: list(set(v)) for k, v in entities.items()}
+                entities[ent.label_].add(ent.text)
+        entities = {k: list(v) for k, v in entities.items()}
         
         # Extract headings (if markdown or HTML-like)
-        headings = re.findall(r'^#+\s+(.+)$', text, re.MULTILINE)
-        headings.extend(re.findall(r'<h[1-6]>(.+?)</h[1-6]>', text, re.IGNORECASE))
+        headings = _HEADING_MD_RE.findall(text)
+        headings.extend(_HEADING_HTML_RE.findall(text))
         
         # Extract URLs
-        urls = re.findall(r'https?://[^\s<>"]+|www\.[^\s<>"]+', text)
+        urls = _URL_RE.findall(text)
         
         # Calculate text hash for deduplication
-        text_hash = hashlib.md5(text.encode()).hexdigest()
+        if text_hash is None:
+            text_hash = self._text_hash(text)
         
         metadata = {
             'source': source,
             'char_count': len(text),
-            'word_count': len(words),
-            'sentence_count': len(sentences),
-            'token_count': len(clean_tokens),
-            'unique_tokens': len(set(clean_tokens)),
+            'word_count': word_count,
+            'sentence_count': sentence_count,
+            'token_count': token_count,
+            'unique_tokens': len(word_freq),
             'keywords': keywords,
             'entities': entities,
             'headings': headings[:10],  # Top 10 headings
             'urls': urls[:20],  # Top 20 URLs
             'timestamp': datetime.now().isoformat(),
             'text_hash': text_hash,
-            'avg_sentence_length': len(words) / len(sentences) if sentences else 0,
-            'lexical_diversity': len(set(clean_tokens)) / len(clean_tokens) if clean_tokens else 0
+            'avg_sentence_length': word_count / sentence_count if sentence_count else 0,
+            'lexical_diversity': len(word_freq) / token_count if token_count else 0
         }
         
         # Add title if available
@@ -179,34 +421,69 @@ class DocumentProcessor:
         all_metadata = []
         total_tokens = 0
         total_chars = 0
-        all_keywords = []
-        all_entities = {'PERSON': [], 'ORG': [], 'GPE': [], 'PRODUCT': [], 'EVENT': [], 'DATE': []}
+        keyword_freq = Counter()  # documents listing each keyword in their top 20
+        all_entities = {label: set() for label in self.ENTITY_LABELS}
         
+        # Read every file first so spaCy can process the texts as one batch
+        texts = []
+        sources = []
+        titles = []
         for file_path in file_paths:
             try:
                 text = self.extract_text_from_file(file_path)
-                metadata = self.extract_metadata(text, source=file_path)
+            except Exception as e:
+                print(f"Error processing {file_path}: {str(e)}")
+                continue
+            texts.append(text)
+            sources.append(file_path)
+            titles.append(self._pop_json_title())
+        
+        # Only texts not seen before (in this run or a cached one) go through spaCy
+        hashes = [self._text_hash(text) for text in texts]
+        keys = [self._cache_key(text, text_hash) for text, text_hash in zip(texts, hashes)]
+        pending = set()
+        seen = set()
+        for i, key in enumerate(keys):
+            if key not in self._cache_entries and key not in seen:
+                pending.add(i)
+                seen.add(key)
+        
+        # Worker processes only pay off once there are enough documents
+        n_process = max(1, (os.cpu_count() or 2) // 2) if len(pending) >= self.PARALLEL_MIN_DOCS else 1
+        docs = self._pipe_texts([texts[i] for i in sorted(pending)], n_process=n_process)
+        
+        for i, (text, file_path, title) in enumerate(zip(texts, sources, titles)):
+            try:
+                if i in pending:
+                    metadata = self.extract_metadata_from_doc(next(docs), text, source=file_path,
+                                                              title=title, text_hash=hashes[i])
+                    self._cache_metadata(keys[i], metadata)
+                else:
+                    metadata = self._get_cached_metadata(keys[i], file_path, title)
+                    if metadata is None:
+                        raise ValueError("duplicate of a document that failed to process")
                 
                 all_texts.append(text)
                 all_metadata.append(metadata)
                 total_tokens += metadata['token_count']
                 total_chars += metadata['char_count']
-                all_keywords.extend(metadata['keywords'])
+                keyword_freq.update(metadata['keywords'])
                 
                 # Aggregate entities
                 for entity_type in all_entities:
-                    all_entities[entity_type].extend(metadata['entities'].get(entity_type, []))
+                    all_entities[entity_type].update(metadata['entities'].get(entity_type, ()))
                 
             except Exception as e:
                 print(f"Error processing {file_path}: {str(e)}")
                 continue
         
+        self._save_metadata_cache()
+        
         # Get top keywords across corpus
-        keyword_freq = Counter(all_keywords)
         top_keywords = [word for word, count in keyword_freq.most_common(50)]
         
         # Get unique entities
-        unique_entities = {k: list(set(v)) for k, v in all_entities.items()}
+        unique_entities = {k: list(v) for k, v in all_entities.items()}
         
         return {
             'corpus_name': corpus_name,
@@ -222,15 +499,12 @@ class DocumentProcessor:
     
     def save_corpus_data(self, corpus_data: Dict[str, Any], output_path: str):
         """Save processed corpus data to JSON"""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(corpus_data, f, indent=2, ensure_ascii=False)
+        Path(output_path).write_bytes(_dump_json(corpus_data))
         print(f"Corpus data saved to: {output_path}")
 
 
 def main():
     """Example usage"""
-    processor = DocumentProcessor()
-    
     # Example: Process your organization's content
     your_files = [
         # Add your content file paths here
@@ -245,6 +519,12 @@ def main():
         # "path/to/competitor/content2.html",
     ]
     
+    if not your_files and not competitor_files:
+        print("No files configured; nothing to ingest.")
+        return
+    
+    processor = DocumentProcessor(cache_path='data/metadata_cache.json')
+    
     if your_files:
         your_corpus = processor.process_corpus(your_files, "your_organization")
         processor.save_corpus_data(your_corpus, "data/your_content_corpus.json")
@@ -8,174 +8,51 @@ from bs4 import BeautifulSoup
 import json
 import time
 import os
+import threading
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin, urlparse
 from datetime import datetime, timedelta
 import re
 import hashlib
+from collections import Counter
+from pathlib import Path
 
-class ContentScraper:
-    """Scrapes content from project management tool websites"""
+try:
+    import orjson
     
-    def __init__(self, deduplicate: bool = True, refresh_days: int = 30, force: bool = False, index_path: str = 'data/scrape_index.json'):
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
-        self.deduplicate = deduplicate
-        self.refresh_days = refresh_days
-        self.force = force
-        self.index_path = index_path
-        self.index = self._load_index()
+    def _dump_json(obj) -> bytes:
+        """Serialize to indented UTF-8 JSON"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _dump_json(obj) -> bytes:
+        """Serialize to indented UTF-8 JSON"""
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
 
-    # ----------------------------------------------------------------------------------
-    # Index Management
-    # ----------------------------------------------------------------------------------
-    def _load_index(self):
-        if os.path.exists(self.index_path):
-            try:
-                with open(self.index_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception:
-                return {'entries': []}
-        return {'entries': []}
+# lxml's C parser is much faster than the pure-Python html.parser
+try:
+    import lxml
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
 
-    def _save_index(self):
-        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
-        with open(self.index_path, 'w', encoding='utf-8') as f:
-            json.dump(self.index, f, indent=2, ensure_ascii=False)
+# Patterns used on every scraped page, compiled once
+_WORD_RE = re.compile(r'\b[a-z]{4,}\b')
 
-    def _find_by_url(self, url):
-        for e in self.index['entries']:
-            if e['url'] == url:
-                return e
-        return None
-
-    def _find_by_hash(self, content_hash):
-        for e in self.index['entries']:
-            if e['content_hash'] == content_hash:
-                return e
-        return None
+# Algorithm behind index content hashes; entries hashed otherwise are re-hashed on next scrape
+CONTENT_HASH_ALGORITHM = 'blake2b-128'
 
-    def _add_index_entry(self, url, title, content_hash, word_count):
-        entry = self._find_by_url(url)
-        now = datetime.utcnow().isoformat()
-        if entry:
-            entry.update({'title': title, 'content_hash': content_hash, 'word_count': word_count, 'last_scraped': now})
-        else:
-            self.index['entries'].append({
-                'url': url,
-                'title': title,
-                'content_hash': content_hash,
-                'word_count': word_count,
-                'first_scraped': now,
-                'last_scraped': now
-            })
-        self._save_index()
+# Returned by scrape_page when the server answers a conditional GET with 304
+NOT_MODIFIED = object()
 
-    def _is_fresh(self, entry):
-        if not entry:
-            return False
-        try:
-            last = datetime.fromisoformat(entry['last_scraped'].replace('Z', ''))
-        except Exception:
-            return False
-        return datetime.utcnow() - last < timedelta(days=self.refresh_days)
-    
-    def scrape_page(self, url, max_retries=3):
-        """Scrape a single page"""
-        for attempt in range(max_retries):
-            try:
-                response = self.session.get(url, timeout=10)
-                response.raise_for_status()
-                return response.text
-            except Exception as e:
-                print(f"  ⚠ Attempt {attempt + 1} failed for {url}: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(2)
-                else:
-                    return None
-    
-    def extract_content(self, html, url):
-        """Extract structured content from HTML"""
-        if not html:
-            return None
-        
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # Remove script and style elements
-        for script in soup(["script", "style", "nav", "footer", "header"]):
-            script.decompose()
-        
-        # Extract title
-        title = soup.find('title')
-        title = title.get_text().strip() if title else urlparse(url).path.strip('/')
-        
-        # Extract main content
-        content_tags = soup.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'li'])
-        content = ' '.join([tag.get_text().strip() for tag in content_tags if tag.get_text().strip()])
-        
-        # Extract meta description
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        description = meta_desc['content'] if meta_desc and 'content' in meta_desc.attrs else ''
-        
-        # Extract keywords from meta or generate from content
-        meta_keywords = soup.find('meta', attrs={'name': 'keywords'})
-        if meta_keywords and 'content' in meta_keywords.attrs:
-            keywords = [k.strip() for k in meta_keywords['content'].split(',')]
-        else:
-            # Extract common words as keywords
-            words = re.findall(r'\b[a-z]{4,}\b', content.lower())
-            from collections import Counter
-            keywords = [word for word, count in Counter(words).most_common(10)]
-        
-        # Extract links
-        links = []
-        for link in soup.find_all('a', href=True):
-            href = urljoin(url, link['href'])
-            if urlparse(href).netloc == urlparse(url).netloc:
-                links.append(href)
-        
-        # Count words
-        word_count = len(content.split())
-
-        # Content hash (normalized)
-        normalized = re.sub(r'\s+', ' ', content.strip().lower())
-        content_hash = hashlib.sha256(normalized.encode('utf-8')).hexdigest()
-        
-        return {
-            'title': title,
-            'url': url,
-            'published_at': None,
-            'updated_at': datetime.now().isoformat(),
-            'author': None,
-            'tags': keywords[:10],
-            'content_type': 'webpage',
-            'word_count': word_count,
-            'content': content[:5000],  # Limit content length
-            'description': description,
-            'links': links[:20],  # Limit links
-            'entities': [],
-            'language': 'en',
-            'content_hash': content_hash
-        }
-    
-    def save_content(self, content_data, output_dir, filename):
-        """Save content as JSON"""
-        os.makedirs(output_dir, exist_ok=True)
-        filepath = os.path.join(output_dir, filename)
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            # Remove hash before persisting if not needed externally (keep for now)
-            json.dump(content_data, f, indent=2, ensure_ascii=False)
-        
-        return filepath
-    
-    def scrape_openproject(self, max_pages=50):
-        """Scrape OpenProject website"""
-        print("\n🔍 Scraping OpenProject...")
-        
-        urls = [
+# Sites to scrape, your company first. Pages are saved to the site's output_dir
+# as <name>_<url path>.json
+SITES = {
+    'openproject': {
+        'label': 'OpenProject',
+        'output_dir': 'data/your_content',
+        'max_pages': 50,
+        'urls': [
             'https://www.openproject.org/docs/',
             'https://www.openproject.org/docs/user-guide/',
             'https://www.openproject.org/docs/user-guide/gantt-chart/',
@@ -226,41 +103,13 @@ class ContentScraper:
             'https://www.openproject.org/docs/user-guide/wysiwyg/',
             'https://www.openproject.org/docs/faq/',
             'https://www.openproject.org/community/',
-        ]
-        
-        scraped = 0
-        for url in urls[:max_pages]:
-            print(f"  📄 Scraping: {url}")
-            if self.deduplicate:
-                existing = self._find_by_url(url)
-                if existing and (self.force is False) and self._is_fresh(existing):
-                    print("    ↷ Skipped (fresh in index, deduplicate ON)")
-                    continue
-            html = self.scrape_page(url)
-            if html:
-                content = self.extract_content(html, url)
-                if content and content['word_count'] > 100:
-                    if self.deduplicate:
-                        duplicate = self._find_by_hash(content['content_hash'])
-                        if duplicate and duplicate['url'] != url:
-                            print(f"    ↷ Skipped (duplicate content of {duplicate['url']})")
-                            continue
-                    filename = f"openproject_{urlparse(url).path.strip('/').replace('/', '_')[:50]}.json"
-                    filepath = self.save_content(content, 'data/your_content', filename)
-                    print(f"    ✓ Saved: {filename} ({content['word_count']} words)")
-                    if self.deduplicate:
-                        self._add_index_entry(url, content['title'], content['content_hash'], content['word_count'])
-                    scraped += 1
-                    time.sleep(1)  # Be polite
-        
-        print(f"✅ OpenProject: {scraped} pages scraped")
-        return scraped
-    
-    def scrape_asana(self, max_pages=40):
-        """Scrape Asana website"""
-        print("\n🔍 Scraping Asana...")
-        
-        urls = [
+        ],
+    },
+    'asana': {
+        'label': 'Asana',
+        'output_dir': 'data/competitor_content',
+        'max_pages': 40,
+        'urls': [
             'https://asana.com/guide',
             'https://asana.com/guide/team/project-management',
             'https://asana.com/guide/examples/project-management/project-plan',
@@ -301,41 +150,13 @@ class ContentScraper:
             'https://asana.com/resources/project-charter',
             'https://asana.com/resources/resource-management',
             'https://asana.com/security',
-        ]
-        
-        scraped = 0
-        for url in urls[:max_pages]:
-            print(f"  📄 Scraping: {url}")
-            if self.deduplicate:
-                existing = self._find_by_url(url)
-                if existing and (self.force is False) and self._is_fresh(existing):
-                    print("    ↷ Skipped (fresh in index, deduplicate ON)")
-                    continue
-            html = self.scrape_page(url)
-            if html:
-                content = self.extract_content(html, url)
-                if content and content['word_count'] > 100:
-                    if self.deduplicate:
-                        duplicate = self._find_by_hash(content['content_hash'])
-                        if duplicate and duplicate['url'] != url:
-                            print(f"    ↷ Skipped (duplicate content of {duplicate['url']})")
-                            continue
-                    filename = f"asana_{urlparse(url).path.strip('/').replace('/', '_')[:50]}.json"
-                    filepath = self.save_content(content, 'data/competitor_content', filename)
-                    print(f"    ✓ Saved: {filename} ({content['word_count']} words)")
-                    if self.deduplicate:
-                        self._add_index_entry(url, content['title'], content['content_hash'], content['word_count'])
-                    scraped += 1
-                    time.sleep(1)
-        
-        print(f"✅ Asana: {scraped} pages scraped")
-        return scraped
-    
-    def scrape_trello(self, max_pages=35):
-        """Scrape Trello website"""
-        print("\n🔍 Scraping Trello...")
-        
-        urls = [
+        ],
+    },
+    'trello': {
+        'label': 'Trello',
+        'output_dir': 'data/competitor_content',
+        'max_pages': 35,
+        'urls': [
             'https://trello.com/guide',
             'https://trello.com/en/tour',
             'https://trello.com/templates',
@@ -371,41 +192,13 @@ class ContentScraper:
             'https://trello.com/solutions',
             'https://trello.com/security',
             'https://trello.com/business-class',
-        ]
-        
-        scraped = 0
-        for url in urls[:max_pages]:
-            print(f"  📄 Scraping: {url}")
-            if self.deduplicate:
-                existing = self._find_by_url(url)
-                if existing and (self.force is False) and self._is_fresh(existing):
-                    print("    ↷ Skipped (fresh in index, deduplicate ON)")
-                    continue
-            html = self.scrape_page(url)
-            if html:
-                content = self.extract_content(html, url)
-                if content and content['word_count'] > 100:
-                    if self.deduplicate:
-                        duplicate = self._find_by_hash(content['content_hash'])
-                        if duplicate and duplicate['url'] != url:
-                            print(f"    ↷ Skipped (duplicate content of {duplicate['url']})")
-                            continue
-                    filename = f"trello_{urlparse(url).path.strip('/').replace('/', '_')[:50]}.json"
-                    filepath = self.save_content(content, 'data/competitor_content', filename)
-                    print(f"    ✓ Saved: {filename} ({content['word_count']} words)")
-                    if self.deduplicate:
-                        self._add_index_entry(url, content['title'], content['content_hash'], content['word_count'])
-                    scraped += 1
-                    time.sleep(1)
-        
-        print(f"✅ Trello: {scraped} pages scraped")
-        return scraped
-    
-    def scrape_monday(self, max_pages=35):
-        """Scrape Monday.com website"""
-        print("\n🔍 Scraping Monday.com...")
-        
-        urls = [
+        ],
+    },
+    'monday': {
+        'label': 'Monday.com',
+        'output_dir': 'data/competitor_content',
+        'max_pages': 35,
+        'urls': [
             'https://monday.com/product',
             'https://monday.com/pricing',
             'https://monday.com/templates',
@@ -441,34 +234,292 @@ class ContentScraper:
             'https://monday.com/construction',
             'https://monday.com/nonprofit',
             'https://monday.com/education',
-        ]
+        ],
+    },
+}
+
+
+class ContentScraper:
+    """Scrapes content from project management tool websites"""
+    
+    def __init__(self, deduplicate: bool = True, refresh_days: int = 30, force: bool = False, index_path: str = 'data/scrape_index.json'):
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        }
+        self._local = threading.local()
+        self._index_lock = threading.Lock()
+        self.deduplicate = deduplicate
+        self.refresh_days = refresh_days
+        self.force = force
+        self.index_path = index_path
+        self.index = self._load_index()
+        # In-memory lookups over index entries; the file is written once per run
+        self._by_url = {e['url']: e for e in self.index['entries']}
+        self._by_hash = {e['content_hash']: e for e in self.index['entries'] if e['content_hash']}
+        self._index_dirty = False
+        # ETag / Last-Modified of pages fetched this run, stored with their index entry
+        self._validators = {}
+        atexit.register(self._save_index)
+
+    @property
+    def session(self):
+        """Per-thread HTTP session (sites are scraped from concurrent threads)"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.headers)
+            self._local.session = session
+        return session
+
+    # ----------------------------------------------------------------------------------
+    # Index Management
+    # ----------------------------------------------------------------------------------
+    def _load_index(self):
+        index = {'entries': [], 'hash_algorithm': CONTENT_HASH_ALGORITHM}
+        if os.path.exists(self.index_path):
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    index = json.load(f)
+            except Exception:
+                return index
+
+        # Hashes from another algorithm (older indexes used SHA-256) can never
+        # match new ones; drop them so they aren't compared at all
+        if index.get('hash_algorithm') != CONTENT_HASH_ALGORITHM:
+            for entry in index['entries']:
+                entry['content_hash'] = None
+            index['hash_algorithm'] = CONTENT_HASH_ALGORITHM
+        return index
+
+    def _save_index(self):
+        """Write the index if it changed since the last save"""
+        with self._index_lock:
+            if not self._index_dirty:
+                return
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            Path(self.index_path).write_bytes(_dump_json(self.index))
+            self._index_dirty = False
+
+    def _find_by_url(self, url):
+        return self._by_url.get(url)
+
+    def _find_by_hash(self, content_hash):
+        return self._by_hash.get(content_hash)
+
+    def _add_index_entry(self, url, title, content_hash, word_count):
+        with self._index_lock:
+            entry = self._find_by_url(url)
+            now = datetime.utcnow().isoformat()
+            if entry:
+                if self._by_hash.get(entry['content_hash']) is entry:
+                    del self._by_hash[entry['content_hash']]
+                entry.update({'title': title, 'content_hash': content_hash, 'word_count': word_count, 'last_scraped': now})
+                entry.pop('etag', None)
+                entry.pop('last_modified', None)
+            else:
+                entry = {
+                    'url': url,
+                    'title': title,
+                    'content_hash': content_hash,
+                    'word_count': word_count,
+                    'first_scraped': now,
+                    'last_scraped': now
+                }
+                self.index['entries'].append(entry)
+                self._by_url[url] = entry
+            self._by_hash.setdefault(content_hash, entry)
+            entry.update(self._validators.pop(url, {}))
+            self._index_dirty = True
+
+    def _touch_index_entry(self, url):
+        """Restart the freshness window of a page the server reported unchanged"""
+        with self._index_lock:
+            entry = self._find_by_url(url)
+            if entry:
+                entry['last_scraped'] = datetime.utcnow().isoformat()
+                self._index_dirty = True
+
+    def _conditional_headers(self, url):
+        """If-None-Match / If-Modified-Since for a page already in the index"""
+        if not self.deduplicate or self.force:
+            return {}
+        entry = self._find_by_url(url)
+        if not entry or not entry.get('content_hash'):
+            return {}
+        # Only validators the server sent: our own last_scraped clock could
+        # be skewed against the server's and turn into false 304s
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def _is_fresh(self, entry):
+        if not entry:
+            return False
+        try:
+            last = datetime.fromisoformat(entry['last_scraped'].replace('Z', ''))
+        except Exception:
+            return False
+        return datetime.utcnow() - last < timedelta(days=self.refresh_days)
+    
+    def scrape_page(self, url, max_retries=3):
+        """
+        Scrape a single page
+        
+        Pages already in the index are requested conditionally; NOT_MODIFIED
+        is returned when the server answers 304.
+        """
+        headers = self._conditional_headers(url)
+        for attempt in range(max_retries):
+            try:
+                response = self.session.get(url, headers=headers, timeout=10)
+                if response.status_code == 304:
+                    return NOT_MODIFIED
+                response.raise_for_status()
+                validators = {}
+                if response.headers.get('ETag'):
+                    validators['etag'] = response.headers['ETag']
+                if response.headers.get('Last-Modified'):
+                    validators['last_modified'] = response.headers['Last-Modified']
+                self._validators[url] = validators
+                return response.text
+            except Exception as e:
+                print(f"  ⚠ Attempt {attempt + 1} failed for {url}: {e}")
+                if attempt < max_retries - 1:
+                    time.sleep(2)
+                else:
+                    return None
+    
+    def extract_content(self, html, url):
+        """Extract structured content from HTML"""
+        if not html:
+            return None
+        
+        soup = BeautifulSoup(html, _HTML_PARSER)
+        
+        # Remove script and style elements
+        for script in soup(["script", "style", "nav", "footer", "header"]):
+            script.decompose()
+        
+        # Extract title
+        title = soup.find('title')
+        title = title.get_text().strip() if title else urlparse(url).path.strip('/')
+        
+        # Extract main content; words, candidate keywords and the normalized
+        # (lowercased, single-spaced) hash input are collected in the same pass
+        content_parts = []
+        words = []
+        word_freq = Counter()
+        for tag in soup.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'li']):
+            text = tag.get_text().strip()
+            if not text:
+                continue
+            content_parts.append(text)
+            lowered = text.lower()
+            words.extend(lowered.split())
+            word_freq.update(_WORD_RE.findall(lowered))
+        content = ' '.join(content_parts)
+        
+        # Extract meta description
+        meta_desc = soup.find('meta', attrs={'name': 'description'})
+        description = meta_desc['content'] if meta_desc and 'content' in meta_desc.attrs else ''
+        
+        # Extract keywords from meta or generate from content
+        meta_keywords = soup.find('meta', attrs={'name': 'keywords'})
+        if meta_keywords and 'content' in meta_keywords.attrs:
+            keywords = [k.strip() for k in meta_keywords['content'].split(',')]
+        else:
+            # Extract common words as keywords
+            keywords = [word for word, count in word_freq.most_common(10)]
+        
+        # Extract same-site links (only the first 20 are kept)
+        page_netloc = urlparse(url).netloc
+        links = []
+        for link in soup.find_all('a', href=True):
+            href = urljoin(url, link['href'])
+            if urlparse(href).netloc == page_netloc:
+                links.append(href)
+                if len(links) == 20:
+                    break
+        
+        # Count words
+        word_count = len(words)
+
+        # Content hash (normalized)
+        normalized = ' '.join(words)
+        content_hash = hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).hexdigest()
+        
+        return {
+            'title': title,
+            'url': url,
+            'published_at': None,
+            'updated_at': datetime.now().isoformat(),
+            'author': None,
+            'tags': keywords[:10],
+            'content_type': 'webpage',
+            'word_count': word_count,
+            'content': content[:5000],  # Limit content length
+            'description': description,
+            'links': links[:20],  # Limit links
+            'entities': [],
+            'language': 'en',
+            'content_hash': content_hash
+        }
+    
+    def save_content(self, content_data, output_dir, filename):
+        """Save content as JSON"""
+        os.makedirs(output_dir, exist_ok=True)
+        filepath = os.path.join(output_dir, filename)
+        
+        # Remove hash before persisting if not needed externally (keep for now)
+        Path(filepath).write_bytes(_dump_json(content_data))
+        
+        return filepath
+    
+    def scrape_site(self, name, max_pages=None):
+        """Scrape one of the SITES (up to its configured max_pages by default)"""
+        site = SITES[name]
+        label = site['label']
+        if max_pages is None:
+            max_pages = site['max_pages']
+        print(f"\n🔍 Scraping {label}...")
         
         scraped = 0
-        for url in urls[:max_pages]:
+        for url in site['urls'][:max_pages]:
             print(f"  📄 Scraping: {url}")
             if self.deduplicate:
                 existing = self._find_by_url(url)
                 if existing and (self.force is False) and self._is_fresh(existing):
                     print("    ↷ Skipped (fresh in index, deduplicate ON)")
                     continue
-            html = self.scrape_page(url)
-            if html:
-                content = self.extract_content(html, url)
-                if content and content['word_count'] > 100:
-                    if self.deduplicate:
-                        duplicate = self._find_by_hash(content['content_hash'])
-                        if duplicate and duplicate['url'] != url:
-                            print(f"    ↷ Skipped (duplicate content of {duplicate['url']})")
-                            continue
-                    filename = f"monday_{urlparse(url).path.strip('/').replace('/', '_')[:50]}.json"
-                    filepath = self.save_content(content, 'data/competitor_content', filename)
-                    print(f"    ✓ Saved: {filename} ({content['word_count']} words)")
-                    if self.deduplicate:
-                        self._add_index_entry(url, content['title'], content['content_hash'], content['word_count'])
-                    scraped += 1
-                    time.sleep(1)
+            try:
+                html = self.scrape_page(url)
+                if html is NOT_MODIFIED:
+                    self._touch_index_entry(url)
+                    print("    ↷ Skipped (not modified since last scrape)")
+                    continue
+                if html:
+                    content = self.extract_content(html, url)
+                    if content and content['word_count'] > 100:
+                        if self.deduplicate:
+                            duplicate = self._find_by_hash(content['content_hash'])
+                            if duplicate and duplicate['url'] != url:
+                                print(f"    ↷ Skipped (duplicate content of {duplicate['url']})")
+                                continue
+                        filename = f"{name}_{urlparse(url).path.strip('/').replace('/', '_')[:50]}.json"
+                        filepath = self.save_content(content, site['output_dir'], filename)
+                        print(f"    ✓ Saved: {filename} ({content['word_count']} words)")
+                        if self.deduplicate:
+                            self._add_index_entry(url, content['title'], content['content_hash'], content['word_count'])
+                        scraped += 1
+                        time.sleep(1)  # Be polite
+            finally:
+                # Validators are only kept for pages added to the index
+                self._validators.pop(url, None)
         
-        print(f"✅ Monday.com: {scraped} pages scraped")
+        print(f"✅ {label}: {scraped} pages scraped")
         return scraped
     
     def run_full_scrape(self, openproject_pages=20, competitor_pages=15):
@@ -477,15 +528,16 @@ class ContentScraper:
         print("CONTENT SCRAPER FOR GAP ANALYSIS")
         print("=" * 80)
         
-        total = 0
-        
-        # Scrape your company
-        total += self.scrape_openproject(openproject_pages)
-        
-        # Scrape competitors
-        total += self.scrape_asana(competitor_pages)
-        total += self.scrape_trello(competitor_pages)
-        total += self.scrape_monday(competitor_pages)
+        # Your company, then competitors. Each site is a separate host, so the
+        # sites are scraped concurrently; requests to any one host stay
+        # sequential with the polite delay between them
+        jobs = [
+            (name, openproject_pages if name == 'openproject' else competitor_pages)
+            for name in SITES
+        ]
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            total = sum(executor.map(lambda job: self.scrape_site(*job), jobs))
+        self._save_index()
         
         print("\n" + "=" * 80)
         print(f"✅ SCRAPING COMPLETE - {total} pages collected")
@@ -3,12 +3,22 @@ Content Gap Analysis - Gap Identification and Scoring System
 Identifies missing, thin, outdated, and under-optimized content with impact scoring
 """
 
-import json
+import logging
 import numpy as np
 from typing import Dict, List, Any, Tuple
-from datetime import datetime, timedelta
-from collections import Counter
-import re
+from datetime import datetime
+from collections import Counter, defaultdict
+from functools import lru_cache
+from heapq import nlargest
+from itertools import islice
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(timestamp: str) -> datetime:
+    """Parse an ISO timestamp (documents processed together often share one)"""
+    return datetime.fromisoformat(timestamp)
 
 
 class GapAnalyzer:
@@ -35,25 +45,47 @@ class GapAnalyzer:
             competitive_advantage: Opportunity to differentiate (0-1)
             keyword_count: Number of keywords/opportunities in this gap
         """
+        return int(self.calculate_impact_scores(
+            competitor_frequency, search_volume_estimate, topic_importance,
+            competitive_advantage, keyword_count
+        ))
+    
+    def calculate_impact_scores(self,
+                                competitor_frequency,
+                                search_volume_estimate=0,
+                                topic_importance=0.5,
+                                competitive_advantage=0.5,
+                                keyword_count=0) -> np.ndarray:
+        """
+        Calculate impact scores for many gaps at once
+        
+        Takes the same factors as calculate_impact_score, each as a scalar or
+        an array (broadcast against each other), and returns an int array.
+        """
+        competitor_frequency = np.asarray(competitor_frequency, dtype=float)
+        search_volume_estimate = np.asarray(search_volume_estimate, dtype=float)
+        topic_importance = np.asarray(topic_importance, dtype=float)
+        competitive_advantage = np.asarray(competitive_advantage, dtype=float)
+        keyword_count = np.asarray(keyword_count, dtype=float)
+        
         # Competitor coverage (0-35 points) - more competitors = higher impact
-        comp_score = min(competitor_frequency / 5.0, 1.0) * 35
+        comp_score = np.minimum(competitor_frequency / 5.0, 1.0) * 35
         
         # Search volume estimate (0-30 points)
-        search_score = min(search_volume_estimate / 8000.0, 1.0) * 30
+        search_score = np.minimum(search_volume_estimate / 8000.0, 1.0) * 30
         
         # Business importance (0-20 points)
         importance_score = topic_importance * 20
         
         # Keyword/opportunity richness (0-15 points)
-        keyword_score = min(keyword_count / 50.0, 1.0) * 15
+        keyword_score = np.minimum(keyword_count / 50.0, 1.0) * 15
         
-        total_score = int(comp_score + search_score + importance_score + keyword_score)
+        total_score = (comp_score + search_score + importance_score + keyword_score).astype(np.int64)
         
         # Add variability bonus for competitive advantage
-        if competitive_advantage > 0.7:
-            total_score += 5
+        total_score += np.where(competitive_advantage > 0.7, 5, 0)
         
-        return min(max(total_score, 15), 100)
+        return np.clip(total_score, 15, 100)
     
     def determine_difficulty(self, 
                            word_count_needed: int,
@@ -69,15 +101,27 @@ class GapAnalyzer:
             technical_complexity: 'low', 'medium', 'high'
             resource_requirements: List of required resources
         """
-        score = 0
-        
         # Word count factor
         if word_count_needed < 1000:
-            score += 1
+            word_score = 1
         elif word_count_needed < 2500:
-            score += 2
+            word_score = 2
         else:
-            score += 3
+            word_score = 3
+        
+        # Resource requirements factor
+        resource_score = min(len(resource_requirements), 3) if resource_requirements else 0
+        
+        return self._difficulty_level(word_score, research_depth, technical_complexity, resource_score)
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _difficulty_level(word_score: int,
+                          research_depth: str,
+                          technical_complexity: str,
+                          resource_score: int) -> str:
+        """Difficulty for the bucketed factors (few distinct inputs, so cached)"""
+        score = word_score + resource_score
         
         # Research depth factor
         depth_scores = {'low': 1, 'medium': 2, 'high': 3}
@@ -87,10 +131,6 @@ class GapAnalyzer:
         complexity_scores = {'low': 1, 'medium': 2, 'high': 3}
         score += complexity_scores.get(technical_complexity, 2)
         
-        # Resource requirements factor
-        if resource_requirements:
-            score += min(len(resource_requirements), 3)
-        
         # Determine difficulty level
         if score <= 4:
             return 'low'
@@ -110,31 +150,32 @@ class GapAnalyzer:
         
         # Analyze competitor topics
         topic_coverage = Counter()
-        topic_keywords = {}
+        topic_keywords = defaultdict(list)
         
         for comp_topic in competitor_topics:
             topic_words = comp_topic.get('words', [])
-            for word in topic_words[:5]:  # Top 5 words per topic
-                word_lower = word.lower()
-                if word_lower not in your_topic_set:
-                    topic_coverage[word_lower] += 1
-                    if word_lower not in topic_keywords:
-                        topic_keywords[word_lower] = []
-                    topic_keywords[word_lower].extend(topic_words[:10])
+            top_words = topic_words[:10]
+            # Top 5 words per topic that you don't cover
+            new_words = [w for w in (word.lower() for word in topic_words[:5]) if w not in your_topic_set]
+            topic_coverage.update(new_words)
+            for word_lower in new_words:
+                topic_keywords[word_lower].extend(top_words)
         
         # Create gap entries for significant missing topics
-        for topic, frequency in topic_coverage.most_common(20):
-            related_keywords = list(set(topic_keywords[topic]))[:15]
-            
-            # More varied scoring based on frequency and keyword richness
-            impact = self.calculate_impact_score(
-                competitor_frequency=frequency,
-                search_volume_estimate=frequency * 600,
-                topic_importance=min(0.5 + (frequency / 10.0), 1.0),
-                competitive_advantage=0.7 if frequency >= 3 else 0.5,
-                keyword_count=len(related_keywords)
-            )
-            
+        top_topics = topic_coverage.most_common(20)
+        related = [list(set(topic_keywords[topic]))[:15] for topic, _ in top_topics]
+        
+        # More varied scoring based on frequency and keyword richness
+        frequencies = np.array([frequency for _, frequency in top_topics], dtype=float)
+        impacts = self.calculate_impact_scores(
+            competitor_frequency=frequencies,
+            search_volume_estimate=frequencies * 600,
+            topic_importance=np.minimum(0.5 + (frequencies / 10.0), 1.0),
+            competitive_advantage=np.where(frequencies >= 3, 0.7, 0.5),
+            keyword_count=[len(keywords) for keywords in related]
+        )
+        
+        for (topic, frequency), related_keywords, impact in zip(top_topics, related, impacts.tolist()):
             # Vary difficulty based on topic complexity
             word_estimate = 1000 + (frequency * 200)
             difficulty = self.determine_difficulty(
@@ -155,63 +196,109 @@ class GapAnalyzer:
         
         return gaps
     
+    def _extract_doc_features(self, documents: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+        """
+        Collect the document fields the gap checks use, in one pass
+        
+        Returns parallel lists (one item per document) so analyze_all_gaps
+        can walk each corpus once and share the result between checks.
+        """
+        keywords = []
+        word_counts = []
+        timestamps = []
+        labels = []
+        for doc in documents:
+            keywords.append(doc.get('keywords', []))
+            word_counts.append(doc.get('word_count', 0))
+            timestamps.append(doc.get('timestamp', ''))
+            labels.append(doc.get('title', doc.get('source', 'Unknown').split('/')[-1]))
+        return {
+            'keywords': keywords,
+            'word_counts': word_counts,
+            'timestamps': timestamps,
+            'labels': labels
+        }
+    
     def identify_thin_content(self,
                             your_documents: List[Dict[str, Any]],
                             competitor_documents: List[Dict[str, Any]],
                             similarity_threshold: float = 0.4) -> List[Dict[str, Any]]:
         """Identify topics you cover superficially compared to competitors"""
+        return self._thin_content_gaps(
+            self._extract_doc_features(your_documents),
+            self._extract_doc_features(competitor_documents)
+        )
+    
+    def _thin_content_gaps(self,
+                           your_features: Dict[str, List[Any]],
+                           comp_features: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
         
         gaps = []
         
-        # Compare document depth (word count, keyword density, etc.)
-        your_doc_by_topic = {}
-        for doc in your_documents:
-            keywords = doc.get('keywords', [])
+        # Compare document depth (word count, keyword density, etc.);
+        # word counts are summed per topic while grouping the documents.
+        # Your side only needs document counts; competitor documents are
+        # indexed by primary keyword for the gap's keyword list
+        your_docs_by_topic = Counter()
+        your_words_by_topic = Counter()
+        for keywords, word_count in zip(your_features['keywords'], your_features['word_counts']):
             for kw in keywords[:3]:  # Primary keywords
-                if kw not in your_doc_by_topic:
-                    your_doc_by_topic[kw] = []
-                your_doc_by_topic[kw].append(doc)
+                your_docs_by_topic[kw] += 1
+                your_words_by_topic[kw] += word_count
         
-        comp_doc_by_topic = {}
-        for doc in competitor_documents:
-            keywords = doc.get('keywords', [])
+        comp_keywords = comp_features['keywords']
+        comp_doc_by_topic = defaultdict(list)
+        comp_words_by_topic = Counter()
+        for i, (keywords, word_count) in enumerate(zip(comp_keywords, comp_features['word_counts'])):
             for kw in keywords[:3]:
-                if kw not in comp_doc_by_topic:
-                    comp_doc_by_topic[kw] = []
-                comp_doc_by_topic[kw].append(doc)
-        
-        # Find topics where your content is thinner
-        for topic in your_doc_by_topic:
-            if topic in comp_doc_by_topic:
-                your_avg_words = np.mean([d.get('word_count', 0) for d in your_doc_by_topic[topic]])
-                comp_avg_words = np.mean([d.get('word_count', 0) for d in comp_doc_by_topic[topic]])
-                
-                # If competitors have significantly more content (lowered threshold to 1.3x)
-                if comp_avg_words > your_avg_words * 1.3:
-                    word_gap = int(comp_avg_words - your_avg_words)
-                    impact = self.calculate_impact_score(
-                        competitor_frequency=len(comp_doc_by_topic[topic]),
-                        search_volume_estimate=word_gap * 2,
-                        topic_importance=min(0.5 + (word_gap / 2000.0), 1.0),
-                        competitive_advantage=0.6,
-                        keyword_count=len(comp_doc_by_topic[topic])
-                    )
-                    
-                    difficulty = self.determine_difficulty(
-                        word_count_needed=word_gap,
-                        research_depth='medium' if word_gap > 1000 else 'low',
-                        technical_complexity='low'
-                    )
-                    
-                    gaps.append({
-                        'title': f"Expand coverage of {topic.title()}",
-                        'gap_type': 'thin',
-                        'keywords': [topic] + [d.get('keywords', [])[0] for d in comp_doc_by_topic[topic] if d.get('keywords')],
-                        'impact_score': impact,
-                        'difficulty': difficulty,
-                        'reason': f"Your content ({int(your_avg_words)} words avg) is thinner than competitors ({int(comp_avg_words)} words avg)",
-                        'competitor_coverage': f"{len(comp_doc_by_topic[topic])} competitor documents"
-                    })
+                comp_doc_by_topic[kw].append(i)
+                comp_words_by_topic[kw] += word_count
+        
+        # Average word counts for the topics both sides cover (in your
+        # topics' order, which decides the top 10 below)
+        shared_topics = [topic for topic in your_docs_by_topic if topic in comp_doc_by_topic]
+        your_avg = (np.array([your_words_by_topic[t] for t in shared_topics], dtype=float)
+                    / np.array([your_docs_by_topic[t] for t in shared_topics], dtype=float))
+        comp_avg = (np.array([comp_words_by_topic[t] for t in shared_topics], dtype=float)
+                    / np.array([len(comp_doc_by_topic[t]) for t in shared_topics], dtype=float))
+        
+        # Find topics where your content is thinner: competitors have
+        # significantly more content (lowered threshold to 1.3x)
+        is_thin = comp_avg > your_avg * 1.3
+        thin_topics = [
+            (topic, your_avg_words, comp_avg_words)
+            for topic, your_avg_words, comp_avg_words, thin
+            in zip(shared_topics, your_avg.tolist(), comp_avg.tolist(), is_thin.tolist())
+            if thin
+        ]
+        
+        word_gaps = np.array([int(comp - yours) for _, yours, comp in thin_topics], dtype=float)
+        comp_doc_counts = [len(comp_doc_by_topic[topic]) for topic, _, _ in thin_topics]
+        impacts = self.calculate_impact_scores(
+            competitor_frequency=comp_doc_counts,
+            search_volume_estimate=word_gaps * 2,
+            topic_importance=np.minimum(0.5 + (word_gaps / 2000.0), 1.0),
+            competitive_advantage=0.6,
+            keyword_count=comp_doc_counts
+        )
+        
+        for (topic, your_avg_words, comp_avg_words), impact in zip(thin_topics, impacts.tolist()):
+            word_gap = int(comp_avg_words - your_avg_words)
+            difficulty = self.determine_difficulty(
+                word_count_needed=word_gap,
+                research_depth='medium' if word_gap > 1000 else 'low',
+                technical_complexity='low'
+            )
+            
+            gaps.append({
+                'title': f"Expand coverage of {topic.title()}",
+                'gap_type': 'thin',
+                'keywords': [topic] + [comp_keywords[i][0] for i in comp_doc_by_topic[topic] if comp_keywords[i]],
+                'impact_score': impact,
+                'difficulty': difficulty,
+                'reason': f"Your content ({int(your_avg_words)} words avg) is thinner than competitors ({int(comp_avg_words)} words avg)",
+                'competitor_coverage': f"{len(comp_doc_by_topic[topic])} competitor documents"
+            })
         
         return gaps[:10]  # Top 10 thin content gaps
     
@@ -219,109 +306,137 @@ class GapAnalyzer:
                                  your_documents: List[Dict[str, Any]],
                                  age_threshold_days: int = 365) -> List[Dict[str, Any]]:
         """Identify content that needs updating"""
+        return self._outdated_content_gaps(self._extract_doc_features(your_documents), age_threshold_days)
+    
+    def _outdated_content_gaps(self,
+                               your_features: Dict[str, List[Any]],
+                               age_threshold_days: int = 365) -> List[Dict[str, Any]]:
         
         gaps = []
-        current_date = datetime.now()
+        current_date = np.datetime64(datetime.now(), 'us')
         
-        for doc in your_documents:
-            timestamp = doc.get('timestamp', '')
+        dated = []  # (document index, naive datetime)
+        for i, timestamp in enumerate(your_features['timestamps']):
             if timestamp:
                 try:
-                    doc_date = datetime.fromisoformat(timestamp)
-                    age_days = (current_date - doc_date).days
-                    
-                    if age_days > age_threshold_days:
-                        keywords = doc.get('keywords', [])[:10]
-                        
-                        # Higher impact for older content
-                        age_multiplier = min(age_days / 365.0, 3.0)
-                        impact = self.calculate_impact_score(
-                            competitor_frequency=int(2 + age_multiplier),
-                            search_volume_estimate=int(age_days * 5),
-                            topic_importance=min(0.4 + (age_multiplier * 0.2), 1.0),
-                            competitive_advantage=0.5,
-                            keyword_count=len(keywords)
-                        )
-                        
-                        difficulty = self.determine_difficulty(
-                            word_count_needed=max(500, int(age_days / 2)),
-                            research_depth='medium' if age_days > 730 else 'low',
-                            technical_complexity='low'
-                        )
-                        
-                        gaps.append({
-                            'title': f"Update: {doc.get('title', doc.get('source', 'Unknown').split('/')[-1])}",
-                            'gap_type': 'outdated',
-                            'keywords': keywords,
-                            'impact_score': impact,
-                            'difficulty': difficulty,
-                            'reason': f"Content is {age_days} days old (threshold: {age_threshold_days} days)",
-                            'competitor_coverage': 'N/A - internal update'
-                        })
-                except:
+                    doc_date = _parse_iso(timestamp)
+                except (TypeError, ValueError):
                     continue
+                # Timezone-aware dates can't be compared with the naive current date
+                if doc_date.utcoffset() is None:
+                    dated.append((i, doc_date))
+        
+        # Ages in whole days (floored, like timedelta.days) for all documents at once
+        dates = np.array([doc_date for _, doc_date in dated], dtype='datetime64[us]')
+        ages_days = (current_date - dates) // np.timedelta64(1, 'D')
+        
+        keywords = your_features['keywords']
+        labels = your_features['labels']
+        outdated_docs = []
+        for j in np.flatnonzero(ages_days > age_threshold_days).tolist():
+            i = dated[j][0]
+            outdated_docs.append((labels[i], int(ages_days[j]), keywords[i][:10]))
+        
+        # Higher impact for older content
+        ages = np.array([age_days for _, age_days, _ in outdated_docs], dtype=float)
+        age_multipliers = np.minimum(ages / 365.0, 3.0)
+        impacts = self.calculate_impact_scores(
+            competitor_frequency=(2 + age_multipliers).astype(np.int64),
+            search_volume_estimate=ages * 5,
+            topic_importance=np.minimum(0.4 + (age_multipliers * 0.2), 1.0),
+            competitive_advantage=0.5,
+            keyword_count=[len(doc_keywords) for _, _, doc_keywords in outdated_docs]
+        )
         
-        # Sort by age and return top 10
-        return sorted(gaps, key=lambda x: x['impact_score'], reverse=True)[:10]
+        for (label, age_days, doc_keywords), impact in zip(outdated_docs, impacts.tolist()):
+            difficulty = self.determine_difficulty(
+                word_count_needed=max(500, int(age_days / 2)),
+                research_depth='medium' if age_days > 730 else 'low',
+                technical_complexity='low'
+            )
+            
+            gaps.append({
+                'title': f"Update: {label}",
+                'gap_type': 'outdated',
+                'keywords': doc_keywords,
+                'impact_score': impact,
+                'difficulty': difficulty,
+                'reason': f"Content is {age_days} days old (threshold: {age_threshold_days} days)",
+                'competitor_coverage': 'N/A - internal update'
+            })
+        
+        # Return the top 10 by impact
+        return nlargest(10, gaps, key=lambda x: x['impact_score'])
     
     def identify_underoptimized_content(self,
                                        your_documents: List[Dict[str, Any]],
                                        competitor_keywords: List[str]) -> List[Dict[str, Any]]:
         """Identify content that exists but lacks optimization"""
+        return self._underoptimized_content_gaps(self._extract_doc_features(your_documents), competitor_keywords)
+    
+    def _underoptimized_content_gaps(self,
+                                     your_features: Dict[str, List[Any]],
+                                     competitor_keywords: List[str]) -> List[Dict[str, Any]]:
         
         gaps = []
-        competitor_kw_set = set(competitor_keywords)
+        competitor_kw_set = frozenset(competitor_keywords)
         
-        for doc in your_documents:
-            your_keywords = set(doc.get('keywords', []))
+        underoptimized_docs = []
+        for keywords, label in zip(your_features['keywords'], your_features['labels']):
+            your_keywords = set(keywords)
             
             # Find high-value competitor keywords missing from your content
             missing_keywords = competitor_kw_set - your_keywords
             
             if len(missing_keywords) > 3:  # Lower threshold to find more gaps
-                missing_count = len(missing_keywords)
-                impact = self.calculate_impact_score(
-                    competitor_frequency=min(int(missing_count / 5), 8),
-                    search_volume_estimate=missing_count * 150,
-                    topic_importance=min(0.5 + (missing_count / 100.0), 0.9),
-                    competitive_advantage=0.7,
-                    keyword_count=missing_count
+                underoptimized_docs.append((label, missing_keywords))
+        
+        missing_counts = np.array([len(missing) for _, missing in underoptimized_docs], dtype=float)
+        impacts = self.calculate_impact_scores(
+            competitor_frequency=np.minimum((missing_counts / 5).astype(np.int64), 8),
+            search_volume_estimate=missing_counts * 150,
+            topic_importance=np.minimum(0.5 + (missing_counts / 100.0), 0.9),
+            competitive_advantage=0.7,
+            keyword_count=missing_counts
+        )
+        
+        for (label, missing_keywords), impact in zip(underoptimized_docs, impacts.tolist()):
+            missing_count = len(missing_keywords)
+            
+            # Vary difficulty based on keyword count and optimization complexity
+            if missing_count > 40:
+                # Extensive optimization required
+                difficulty = self.determine_difficulty(
+                    word_count_needed=1500 + (missing_count * 15),
+                    research_depth='high',
+                    technical_complexity='medium'
+                )
+            elif missing_count > 25:
+                # Moderate optimization
+                difficulty = self.determine_difficulty(
+                    word_count_needed=1000 + (missing_count * 12),
+                    research_depth='medium',
+                    technical_complexity='medium'
+                )
+            else:
+                # Light optimization
+                difficulty = self.determine_difficulty(
+                    word_count_needed=500 + (missing_count * 10),
+                    research_depth='low',
+                    technical_complexity='low'
                 )
-                
-                # Vary difficulty based on keyword count and optimization complexity
-                if missing_count > 40:
-                    # Extensive optimization required
-                    difficulty = self.determine_difficulty(
-                        word_count_needed=1500 + (missing_count * 15),
-                        research_depth='high',
-                        technical_complexity='medium'
-                    )
-                elif missing_count > 25:
-                    # Moderate optimization
-                    difficulty = self.determine_difficulty(
-                        word_count_needed=1000 + (missing_count * 12),
-                        research_depth='medium',
-                        technical_complexity='medium'
-                    )
-                else:
-                    # Light optimization
-                    difficulty = self.determine_difficulty(
-                        word_count_needed=500 + (missing_count * 10),
-                        research_depth='low',
-                        technical_complexity='low'
-                    )
-                
-                gaps.append({
-                    'title': doc.get('title', doc.get('source', 'Unknown').split('/')[-1]),
-                    'gap_type': 'under-optimized',
-                    'keywords': list(missing_keywords)[:15],
-                    'impact_score': impact,
-                    'difficulty': difficulty,
-                    'reason': f"Missing {len(missing_keywords)} high-value competitor keywords",
-                    'competitor_coverage': f"{len(missing_keywords)} keyword opportunities"
-                })
-        
-        return sorted(gaps, key=lambda x: x['impact_score'], reverse=True)[:10]
+            
+            gaps.append({
+                'title': label,
+                'gap_type': 'under-optimized',
+                'keywords': list(islice(missing_keywords, 15)),
+                'impact_score': impact,
+                'difficulty': difficulty,
+                'reason': f"Missing {len(missing_keywords)} high-value competitor keywords",
+                'competitor_coverage': f"{len(missing_keywords)} keyword opportunities"
+            })
+        
+        return nlargest(10, gaps, key=lambda x: x['impact_score'])
     
     def analyze_all_gaps(self,
                         your_corpus: Dict[str, Any],
@@ -339,8 +454,12 @@ class GapAnalyzer:
         your_topics = comparison_data.get('your_topics', [])
         comp_topics = comparison_data.get('competitor_topics', [])
         
+        # Read each corpus's documents once for the per-document checks
+        your_features = self._extract_doc_features(your_docs)
+        comp_features = self._extract_doc_features(comp_docs)
+        
         # Identify missing content
-        print("Analyzing missing content...")
+        logger.debug("Analyzing %s content...", "missing")
         missing_gaps = self.identify_missing_content(
             your_topics=your_keywords,
             competitor_topics=comp_topics,
@@ -349,18 +468,18 @@ class GapAnalyzer:
         all_gaps.extend(missing_gaps)
         
         # Identify thin content
-        print("Analyzing thin content...")
-        thin_gaps = self.identify_thin_content(your_docs, comp_docs)
+        logger.debug("Analyzing %s content...", "thin")
+        thin_gaps = self._thin_content_gaps(your_features, comp_features)
         all_gaps.extend(thin_gaps)
         
         # Identify outdated content
-        print("Analyzing outdated content...")
-        outdated_gaps = self.identify_outdated_content(your_docs)
+        logger.debug("Analyzing %s content...", "outdated")
+        outdated_gaps = self._outdated_content_gaps(your_features)
         all_gaps.extend(outdated_gaps)
         
         # Identify under-optimized content
-        print("Analyzing under-optimized content...")
-        underopt_gaps = self.identify_underoptimized_content(your_docs, comp_keywords)
+        logger.debug("Analyzing %s content...", "under-optimized")
+        underopt_gaps = self._underoptimized_content_gaps(your_features, comp_keywords)
         all_gaps.extend(underopt_gaps)
         
         # Sort all gaps by impact score
@@ -16,7 +16,7 @@ from topic_modeling import TopicModelingEngine
 from gap_analyzer import GapAnalyzer
 from recommendation_generator import RecommendationGenerator
 from ml_model import GapClassificationModel
-from dashboard_specs import DashboardSpecGenerator
+from dashboard_specs import DashboardSpecGenerator, write_specs
 from report_generator import ReportGenerator
 from presentation_generator import PresentationGenerator
 
@@ -33,7 +33,7 @@ class ContentGapAnalysisOrchestrator:
         self.competitors = competitors or ["Competitor 1", "Competitor 2", "Competitor 3"]
         
         # Initialize all components
-        self.doc_processor = DocumentProcessor()
+        self.doc_processor = DocumentProcessor(cache_path='data/metadata_cache.json')
         self.topic_engine = TopicModelingEngine(n_topics=10, n_clusters=5)
         self.gap_analyzer = GapAnalyzer()
         self.rec_generator = RecommendationGenerator()
@@ -45,6 +45,16 @@ class ContentGapAnalysisOrchestrator:
         # Results storage
         self.results = {}
     
+    def reset(self) -> None:
+        """Clear per-run state so a cached orchestrator can be reused for a new run"""
+        
+        self.results = {}
+        self.ml_model.trained_model = None
+        # Report and slide dates are stamped at construction; refresh them
+        today = datetime.now().strftime('%B %d, %Y')
+        self.report_gen.report_date = today
+        self.presentation_gen.presentation_date = today
+    
     def run_full_analysis(self,
                          your_content_files: List[str],
                          competitor_content_files: List[str],
@@ -149,8 +159,7 @@ class ContentGapAnalysisOrchestrator:
         # Save dashboard specs
         dashboard_path = 'dashboards/dashboard_specifications.json'
         os.makedirs('dashboards', exist_ok=True)
-        with open(dashboard_path, 'w', encoding='utf-8') as f:
-            json.dump(dashboard_specs, f, indent=2, ensure_ascii=False)
+        write_specs(dashboard_specs, dashboard_path)
         
         print(f"  ✓ Dashboard visualizations: {len(dashboard_specs)}")
         print(f"  ✓ Dashboard specs saved: {dashboard_path}")
@@ -0,0 +1,293 @@
+"""Tests for the API server's conditional GET handling"""
+
+import asyncio
+import gzip
+import json
+import os
+import threading
+from email.utils import formatdate
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient
+
+import api_server
+from api_server import JobState, app
+
+
+SAMPLE_RESULTS = {
+    "gaps": [{"gap_type": "missing_topic", "impact_score": 7.5}],
+    "recommendations": [{"title": "Write a guide", "impact_score": 7.5}],
+    "model_metrics": {"accuracy": 0.9},
+}
+
+
+@pytest.fixture
+def client():
+    previous = app.state.job
+    yield TestClient(app)
+    app.state.job = previous
+
+
+@pytest.fixture
+def with_results():
+    app.state.job = JobState(
+        job_id="job-1",
+        status="completed",
+        payloads=api_server._build_payloads(SAMPLE_RESULTS),
+    )
+
+
+@pytest.mark.parametrize("path", ["/package", "/metrics", "/recommendations", "/gaps"])
+def test_results_return_404_before_first_run(client, path):
+    app.state.job = JobState()
+    assert client.get(path).status_code == 404
+
+
+@pytest.mark.parametrize("path", ["/package", "/metrics", "/recommendations", "/gaps"])
+def test_results_revalidate_with_etag(client, with_results, path):
+    first = client.get(path)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "private, max-age=0, must-revalidate"
+
+    cached = client.get(path, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+
+def test_etag_list_and_wildcard_match(client, with_results):
+    etag = client.get("/gaps").headers["etag"]
+
+    assert client.get("/gaps", headers={"If-None-Match": f'"other", {etag}'}).status_code == 304
+    assert client.get("/gaps", headers={"If-None-Match": "*"}).status_code == 304
+    assert client.get("/gaps", headers={"If-None-Match": '"stale"'}).status_code == 200
+
+
+def test_new_results_change_etag(client, with_results):
+    etag = client.get("/metrics").headers["etag"]
+
+    app.state.job = JobState(
+        payloads=api_server._build_payloads({**SAMPLE_RESULTS, "model_metrics": {"accuracy": 0.5}})
+    )
+    response = client.get("/metrics", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json() == {"accuracy": 0.5}
+
+
+@pytest.fixture
+def report(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "reports" / "content_gap_analysis_report.md"
+    path.parent.mkdir()
+    path.write_text("# Report\n")
+    os.utime(path, (1_700_000_000, 1_700_000_000))
+    return path
+
+
+def test_download_not_modified_since(client, report):
+    response = client.get("/download/report", headers={
+        "If-Modified-Since": formatdate(1_700_000_000, usegmt=True)
+    })
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_download_modified_since(client, report):
+    response = client.get("/download/report", headers={
+        "If-Modified-Since": formatdate(1_600_000_000, usegmt=True)
+    })
+    assert response.status_code == 200
+    assert response.text == "# Report\n"
+
+
+def test_download_ignores_malformed_if_modified_since(client, report):
+    response = client.get("/download/report", headers={"If-Modified-Since": "yesterday"})
+    assert response.status_code == 200
+
+
+def test_download_missing_file(client, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert client.get("/download/report").status_code == 404
+    assert client.get("/download/unknown").status_code == 404
+
+
+def _sse_data(chunk):
+    assert chunk.startswith("data: ") and chunk.endswith("\n\n")
+    return json.loads(chunk[len("data: "):])
+
+
+def test_events_stream_job_transitions(client, monkeypatch):
+    app.state.job = JobState(job_id="job-0", status="completed")
+
+    async def run():
+        # The stream never ends, so drive its body iterator directly
+        monkeypatch.setattr(api_server, "_event_loop", asyncio.get_running_loop())
+        response = await api_server.events()
+        assert response.media_type == "text/event-stream"
+        stream = response.body_iterator
+
+        hello = _sse_data(await stream.__anext__())
+        assert hello == {"state": "connected", "job_id": "job-0", "status": "completed"}
+
+        api_server._update_job(job_id="job-1", status="queued", running=True)
+        api_server._update_job(status="running")
+        api_server._update_job(running=True)  # no transition, no event
+        api_server._update_job(status="completed", running=False)
+
+        statuses = [
+            _sse_data(await asyncio.wait_for(stream.__anext__(), 1))["status"]
+            for _ in range(3)
+        ]
+        await stream.aclose()
+        return statuses
+
+    assert asyncio.run(run()) == ["queued", "running", "completed"]
+    assert not api_server._subscribers
+
+
+def test_events_keep_alive(client, monkeypatch):
+    monkeypatch.setattr(api_server, "_SSE_KEEPALIVE_SECONDS", 0.01)
+
+    async def run():
+        stream = (await api_server.events()).body_iterator
+        await stream.__anext__()
+        chunk = await asyncio.wait_for(stream.__anext__(), 1)
+        await stream.aclose()
+        return chunk
+
+    assert asyncio.run(run()) == ": keep-alive\n\n"
+
+
+def test_specs_revalidate_with_etag(client):
+    first = client.get("/specs")
+    assert first.status_code == 200
+    assert set(first.json()) == {"gap_table", "topic_heatmap", "impact_chart",
+                                 "model_metrics", "timeline"}
+    assert first.headers["cache-control"] == "public, max-age=60"
+
+    cached = client.get("/specs", headers={"If-None-Match": first.headers["etag"]})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+
+def test_single_spec_has_its_own_etag(client):
+    bundle_etag = client.get("/specs").headers["etag"]
+    single = client.get("/specs/timeline")
+    assert single.status_code == 200
+    assert single.json() == client.get("/specs").json()["timeline"]
+    assert single.headers["etag"] != bundle_etag
+
+    cached = client.get("/specs/timeline", headers={"If-None-Match": single.headers["etag"]})
+    assert cached.status_code == 304
+    assert client.get("/specs/gap_table", headers={
+        "If-None-Match": single.headers["etag"]
+    }).status_code == 200
+
+
+def test_unknown_spec(client):
+    assert client.get("/specs/nope").status_code == 404
+
+
+def test_shared_job_state_across_workers(client, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(api_server, "_SHARED_STATE", True)
+    app.state.job = JobState()
+
+    api_server._set_job(job_id="job-1", status="queued", running=True)
+    assert json.loads((tmp_path / api_server._JOB_PATH).read_bytes())["job_id"] == "job-1"
+
+    # Another worker finishes a job: this worker picks it up on the next read
+    (tmp_path / api_server._JOB_PATH).write_bytes(json.dumps({
+        "job_id": "job-2", "status": "completed", "running": False,
+        "started_at": "2025-01-01T10:00:00", "completed_at": "2025-01-01T10:02:00"
+    }).encode())
+    os.utime(tmp_path / api_server._JOB_PATH, ns=(1, 1))
+
+    status = client.get("/status").json()
+    assert status["last_job_id"] == "job-2"
+    assert status["job_status"] == "completed"
+    assert status["analysis_running"] is False
+    assert status["completed_at"] == "2025-01-01T10:02:00"
+    assert client.get("/health").json()["last_job_id"] == "job-2"
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_executor_is_rebuilt_after_fork():
+    parent_pool = api_server._get_executor()
+    assert parent_pool.submit(pow, 2, 3).result(timeout=60) == 8
+
+    # What a gunicorn worker does after --preload: inherit the module, then run a job
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            pool = api_server._get_executor()
+            if pool is not parent_pool and pool.submit(pow, 3, 2).result(timeout=60) == 9:
+                code = 0
+            pool.shutdown()
+        finally:
+            os._exit(code)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert api_server._get_executor() is parent_pool
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip", True),
+    ("gzip, deflate, br", True),
+    ("br;q=1.0, gzip;q=0.5", True),
+    ("GZIP ; Q=0.8", True),
+    ("*", True),
+    ("gzip;q=0", False),
+    ("gzip;q=0.0, *;q=1", False),
+    ("*;q=0", False),
+    ("x-gzip-foo, deflate", False),
+    ("identity", False),
+    ("", False),
+])
+def test_accepts_gzip(header, expected):
+    assert api_server._accepts_gzip(header) is expected
+
+
+def test_download_serves_gzip_only_when_accepted(client, report):
+    gz = report.with_name(report.name + ".gz")
+    gz.write_bytes(gzip.compress(b"# Report (gzip)\n"))
+
+    gzipped = client.get("/download/report", headers={"Accept-Encoding": "gzip"})
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert gzipped.text == "# Report (gzip)\n"
+
+    refused = client.get("/download/report", headers={"Accept-Encoding": "gzip;q=0"})
+    assert "content-encoding" not in refused.headers
+    assert refused.text == "# Report\n"
+
+
+def test_shared_reload_runs_off_the_event_loop(client, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(api_server, "_SHARED_STATE", True)
+    app.state.job = JobState()
+    (tmp_path / api_server._PACKAGE_PATH).write_bytes(json.dumps(SAMPLE_RESULTS).encode())
+
+    reload_threads = []
+    reload = api_server._current_job
+
+    def spy():
+        reload_threads.append(threading.get_ident())
+        return reload()
+
+    monkeypatch.setattr(api_server, "_current_job", spy)
+
+    job = asyncio.run(api_server._current_job_async())
+    assert "gaps" in job.payloads
+    assert reload_threads and reload_threads[0] != threading.get_ident()
+
+    # Unchanged files: served from memory without another reload
+    asyncio.run(api_server._current_job_async())
+    assert len(reload_threads) == 1
+    assert client.get("/gaps").status_code == 200
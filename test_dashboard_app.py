@@ -0,0 +1,117 @@
+"""Tests for the dashboard's data-version cache"""
+
+import os
+import tempfile
+
+import pytest
+
+pytest.importorskip("dash")
+pytest.importorskip("flask_caching")
+
+os.environ.setdefault("DASH_CACHE_DIR", tempfile.mkdtemp(prefix="dash_cache_"))
+
+import dashboard_app
+
+
+def _package(score, gap_type="missing_topic"):
+    return {
+        "metadata": {"report_generated": "2025-01-01"},
+        "gaps": [{"gap_type": gap_type, "impact_score": score}],
+        "recommendations": [{
+            "title": "Write a guide",
+            "impact_score": score,
+            "difficulty": "medium",
+            "publish_priority": "2025-02-01",
+            "intent": "informational",
+        }],
+    }
+
+
+@pytest.fixture
+def results(monkeypatch):
+    """Serve a swappable package through load_latest_results"""
+    current = {"data": _package(5)}
+    monkeypatch.setattr(dashboard_app, "load_latest_results", lambda: current["data"])
+    monkeypatch.setattr(dashboard_app, "_CACHE", {"hash": None, "data": None})
+    dashboard_app._render_version.cache_clear()
+    dashboard_app.cache.clear()
+    yield current
+    dashboard_app._render_version.cache_clear()
+    dashboard_app.cache.clear()
+
+
+def test_version_is_stable_for_unchanged_data(results):
+    version = dashboard_app.refresh_cache()
+    assert version == dashboard_app.refresh_cache()
+
+    results["data"] = _package(9)
+    assert dashboard_app.refresh_cache() != version
+
+
+def test_get_cached_data_reloads_on_version_miss(results):
+    version = dashboard_app._data_version(results["data"])
+    assert dashboard_app.get_cached_data(version) is results["data"]
+    assert dashboard_app.get_cached_data(None) is None
+
+
+def test_render_is_memoized_by_version(results):
+    version = dashboard_app.refresh_cache()
+    first = dashboard_app.render_dashboard(version)
+    assert dashboard_app.render_dashboard(version) is first
+    assert dashboard_app._render_version.cache_info().hits == 1
+
+
+def test_render_does_not_cache_other_versions_outputs(results):
+    stale = dashboard_app.refresh_cache()
+    results["data"] = _package(9, gap_type="thin_content")
+    dashboard_app.refresh_cache()
+
+    # The cache moved on: build from what it holds, but don't store it as `stale`
+    outputs = dashboard_app.render_dashboard(stale)
+    assert outputs[2]["data"][0]["labels"] == ["Thin_Content"]
+    assert dashboard_app._render_version.cache_info().currsize == 0
+
+
+def test_render_without_data_shows_loading(results):
+    results["data"] = None
+    outputs = dashboard_app.render_dashboard("missing")
+    assert len(outputs) == 7
+    assert outputs[0].children == "Loading..."
+    assert dashboard_app._render_version.cache_info().currsize == 0
+
+
+def test_normalize_replaces_missing_and_null_fields():
+    data = {
+        "gaps": [{"gap_type": None}],
+        "recommendations": [{"title": "Guide", "publish_priority": None, "intent": None}],
+    }
+    dashboard_app._normalize_records(data)
+
+    assert data["gaps"] == [{"gap_type": "unknown", "impact_score": 0}]
+    assert data["recommendations"] == [{
+        "title": "Guide",
+        "impact_score": 0,
+        "difficulty": "N/A",
+        "publish_priority": "N/A",
+        "intent": "N/A",
+    }]
+    # Renders index these fields directly
+    dashboard_app._build_dashboard(data)
+
+
+def test_difficulty_breakdown_with_unknown_difficulty():
+    import warnings
+
+    recommendations = [
+        {"title": "A", "impact_score": 5, "difficulty": "low"},
+        {"title": "B", "impact_score": 7, "difficulty": "high"},
+        {"title": "C", "impact_score": 3, "difficulty": "N/A"},
+    ]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        figure = dashboard_app.create_difficulty_breakdown(recommendations)
+
+    positions = {trace.name: list(trace.x) for trace in figure.data}
+    assert positions["low"] == [1]
+    assert positions["high"] == [3]
+    assert all(x != x for x in positions["N/A"])  # NaN: not placed on the axis
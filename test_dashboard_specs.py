@@ -0,0 +1,44 @@
+"""Tests for writing the dashboard spec files"""
+
+import gzip
+import json
+import threading
+
+from dashboard_specs import DashboardSpecGenerator, write_specs
+
+
+def test_concurrent_writers_leave_whole_files(tmp_path):
+    output_file = str(tmp_path / "dashboard_specifications.json")
+    specs = DashboardSpecGenerator.generate_all_specs()
+    variants = [{**specs, "writer": {"id": i, "pad": "x" * (1000 * i)}} for i in range(8)]
+
+    errors = []
+
+    def write(variant):
+        try:
+            write_specs(variant, output_file)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(v,)) for v in variants]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+
+    written = json.loads((tmp_path / "dashboard_specifications.json").read_bytes())
+    assert written in variants
+    assert json.loads(gzip.decompress((tmp_path / "dashboard_specifications.json.gz").read_bytes())) in variants
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "dashboard_specifications.json", "dashboard_specifications.json.gz"
+    ]
+
+
+def test_unchanged_specs_are_not_rewritten(tmp_path):
+    output_file = str(tmp_path / "dashboard_specifications.json")
+    specs = DashboardSpecGenerator.generate_all_specs()
+
+    assert write_specs(specs, output_file) is True
+    assert write_specs(specs, output_file) is False
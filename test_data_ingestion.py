@@ -0,0 +1,63 @@
+"""Tests for DocumentProcessor's metadata cache"""
+
+import json
+
+import pytest
+
+nltk = pytest.importorskip("nltk")
+pytest.importorskip("spacy")
+
+try:
+    nltk.data.find('corpora/stopwords')
+except LookupError:
+    pytest.skip("NLTK stopwords corpus not installed", allow_module_level=True)
+
+from data_ingestion import DocumentProcessor
+
+
+@pytest.fixture
+def no_spacy(monkeypatch):
+    def fail():
+        raise AssertionError("spaCy model loaded")
+    monkeypatch.setattr(DocumentProcessor, "_load_spacy_model", classmethod(lambda cls: fail()))
+
+
+def test_cache_is_opt_in(tmp_path, monkeypatch, no_spacy):
+    monkeypatch.chdir(tmp_path)
+    processor = DocumentProcessor()
+    processor._cache_metadata("k", {"keywords": ["a"], "source": "x"})
+    processor._save_metadata_cache()
+
+    assert processor.cache_path is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cache_file_is_not_read_on_construction(tmp_path, no_spacy):
+    cache_path = tmp_path / "metadata_cache.json"
+    cache_path.write_text(json.dumps({"model": "other", "entries": {}}))
+
+    processor = DocumentProcessor(cache_path=str(cache_path))
+    assert processor._metadata_cache is None
+    assert processor._nlp is None
+
+
+def test_cached_entries_are_not_shared_with_callers(no_spacy):
+    processor = DocumentProcessor()
+    metadata = {
+        "source": "a.txt",
+        "timestamp": "t",
+        "keywords": ["gantt", "wiki"],
+        "entities": {"ORG": ["OpenProject"]},
+    }
+    processor._cache_metadata("k", metadata)
+    metadata["keywords"].append("stored-mutation")
+
+    hit = processor._get_cached_metadata("k", "b.txt", None)
+    assert hit["keywords"] == ["gantt", "wiki"]
+    assert hit["source"] == "b.txt"
+
+    hit["keywords"].append("hit-mutation")
+    hit["entities"]["ORG"].append("Asana")
+    again = processor._get_cached_metadata("k", "c.txt", None)
+    assert again["keywords"] == ["gantt", "wiki"]
+    assert again["entities"] == {"ORG": ["OpenProject"]}
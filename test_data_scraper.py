@@ -0,0 +1,133 @@
+"""Tests for the scraper's conditional GET handling"""
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("bs4")
+
+import data_scraper
+from data_scraper import NOT_MODIFIED, ContentScraper
+
+
+URL = "https://example.com/docs/"
+
+
+class StubResponse:
+    def __init__(self, status_code=200, text="", headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class StubSession:
+    """Records request headers and answers with a canned response"""
+
+    def __init__(self, response):
+        self.response = response
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append((url, headers or {}))
+        return self.response
+
+
+def _scraper(tmp_path, response, entry=None, **kwargs):
+    scraper = ContentScraper(index_path=str(tmp_path / "scrape_index.json"), **kwargs)
+    if entry is not None:
+        scraper.index['entries'].append(entry)
+        scraper._by_url[entry['url']] = entry
+        scraper._by_hash[entry['content_hash']] = entry
+    scraper._local.session = StubSession(response)
+    return scraper
+
+
+def _entry(**fields):
+    return {
+        'url': URL,
+        'title': 'Docs',
+        'content_hash': 'abc123',
+        'word_count': 500,
+        'first_scraped': '2020-01-01T00:00:00',
+        'last_scraped': '2020-01-01T00:00:00',
+        **fields
+    }
+
+
+def test_indexed_page_is_requested_conditionally(tmp_path):
+    scraper = _scraper(
+        tmp_path, StubResponse(304),
+        _entry(etag='"v1"', last_modified='Wed, 01 Jan 2020 00:00:00 GMT')
+    )
+
+    assert scraper.scrape_page(URL) is NOT_MODIFIED
+    _, headers = scraper.session.requests[0]
+    assert headers == {
+        'If-None-Match': '"v1"',
+        'If-Modified-Since': 'Wed, 01 Jan 2020 00:00:00 GMT'
+    }
+
+
+def test_local_clock_is_never_a_validator(tmp_path):
+    scraper = _scraper(tmp_path, StubResponse(200), _entry())
+
+    assert scraper._conditional_headers(URL) == {}
+
+
+def test_unindexed_or_forced_pages_are_fetched_unconditionally(tmp_path):
+    assert _scraper(tmp_path, StubResponse(200))._conditional_headers(URL) == {}
+
+    forced = _scraper(tmp_path, StubResponse(200), _entry(etag='"v1"'), force=True)
+    assert forced._conditional_headers(URL) == {}
+
+
+def test_validators_are_stored_with_the_index_entry(tmp_path):
+    scraper = _scraper(tmp_path, StubResponse(200, "<html></html>", {
+        'ETag': '"v2"', 'Last-Modified': 'Thu, 02 Jan 2020 00:00:00 GMT'
+    }))
+
+    assert scraper.scrape_page(URL) == "<html></html>"
+    scraper._add_index_entry(URL, 'Docs', 'def456', 500)
+
+    entry = scraper._find_by_url(URL)
+    assert entry['etag'] == '"v2"'
+    assert entry['last_modified'] == 'Thu, 02 Jan 2020 00:00:00 GMT'
+    assert URL not in scraper._validators
+
+
+def test_not_modified_page_is_touched_not_saved(tmp_path, monkeypatch):
+    monkeypatch.setitem(data_scraper.SITES, 'stub', {
+        'label': 'Stub',
+        'output_dir': str(tmp_path / 'out'),
+        'max_pages': 5,
+        'urls': [URL]
+    })
+    scraper = _scraper(tmp_path, StubResponse(304), _entry(etag='"v1"'))
+    monkeypatch.setattr(scraper, 'save_content', pytest.fail)
+
+    assert scraper.scrape_site('stub') == 0
+    entry = scraper._find_by_url(URL)
+    assert entry['last_scraped'] > '2020-01-01T00:00:00'
+    assert entry['etag'] == '"v1"'
+    assert scraper._index_dirty
+
+    scraper._save_index()
+    assert (tmp_path / "scrape_index.json").exists()
+
+
+def test_validators_of_skipped_pages_are_dropped(tmp_path, monkeypatch):
+    monkeypatch.setitem(data_scraper.SITES, 'stub', {
+        'label': 'Stub',
+        'output_dir': str(tmp_path / 'out'),
+        'max_pages': 5,
+        'urls': [URL]
+    })
+    # Too short to be saved, so it never reaches the index
+    scraper = _scraper(tmp_path, StubResponse(200, "<html><body>Hi</body></html>", {'ETag': '"v3"'}))
+
+    assert scraper.scrape_site('stub') == 0
+    assert scraper._validators == {}
+    assert scraper._find_by_url(URL) is None
@@ -2,6 +2,7 @@
 """Test the improved scoring algorithm to show variability"""
 
 from gap_analyzer import GapAnalyzer
+from collections import Counter
 import random
 
 ga = GapAnalyzer()
@@ -44,10 +45,11 @@ print(f"  • Average: {sum(scores)/len(scores):.1f}")
 print(f"  • Unique scores: {len(set(scores))} different values")
 print(f"  • All scores: {sorted(set(scores))}")
 
+diff_counts = Counter(diffs)
 print("\nDifficulty Distribution:")
-print(f"  • Low: {diffs.count('low')} ({diffs.count('low')/len(diffs)*100:.0f}%)")
-print(f"  • Medium: {diffs.count('medium')} ({diffs.count('medium')/len(diffs)*100:.0f}%)")
-print(f"  • High: {diffs.count('high')} ({diffs.count('high')/len(diffs)*100:.0f}%)")
+print(f"  • Low: {diff_counts['low']} ({diff_counts['low']/len(diffs)*100:.0f}%)")
+print(f"  • Medium: {diff_counts['medium']} ({diff_counts['medium']/len(diffs)*100:.0f}%)")
+print(f"  • High: {diff_counts['high']} ({diff_counts['high']/len(diffs)*100:.0f}%)")
 
 print("\n✅ Scoring algorithm provides varied, realistic scores!")
 print("   (Old algorithm: all scores clustered around 35-41)")